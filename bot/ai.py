@@ -1,34 +1,58 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import ssl
+from typing import Optional
 
-try:
-    from openai import OpenAI
-except Exception:  # pragma: no cover
-    OpenAI = None  # type: ignore
+import httpx
 
 
 logger = logging.getLogger(__name__)
 
+# Building an SSL context is expensive; share one across every HTTP client.
+_SSL_CTX = ssl.create_default_context()
+# In-flight requests per generate_batch call; stays under the HTTP pool's connection limit.
+BATCH_CONCURRENCY = 8
+
 
 class AICoach:
     def __init__(self, api_key: str, model: str) -> None:
         self.model = model
-        self.enabled = bool(api_key) and OpenAI is not None
-        self.client = OpenAI(api_key=api_key) if self.enabled else None  # type: ignore[arg-type]
+        self.enabled = False
+        self._http: Optional[httpx.AsyncClient] = None
+        self.client = None
+        if not api_key:
+            return
+
+        # Imported lazily: openai pulls in pydantic and friends, which slows startup
+        # for installs that run without an API key.
+        try:
+            from openai import AsyncOpenAI
+        except ImportError:  # pragma: no cover
+            logger.warning("openai package is not installed; AI coaching disabled.")
+            return
+
+        self.enabled = True
+        self._http = httpx.AsyncClient(
+            verify=_SSL_CTX,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            timeout=httpx.Timeout(60.0, connect=10.0),
+        )
+        self.client = AsyncOpenAI(api_key=api_key, http_client=self._http)
 
-    def generate(self, system_prompt: str, user_prompt: str) -> str:
+    async def generate(self, system_prompt: str, user_prompt: str) -> str:
         if not self.enabled or self.client is None:
             return ""
 
         # Prefer the Responses API and fall back to Chat Completions for compatibility.
         try:
-            response = self.client.responses.create(
+            response = await self.client.responses.create(
                 model=self.model,
                 temperature=0.4,
                 input=[
-                    {"role": "system", "content": [{"type": "text", "text": system_prompt}]},
-                    {"role": "user", "content": [{"type": "text", "text": user_prompt}]},
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
                 ],
             )
             text = getattr(response, "output_text", "")
@@ -38,7 +62,7 @@ class AICoach:
             logger.warning("Responses API failed, trying chat completions fallback: %s", exc)
 
         try:
-            completion = self.client.chat.completions.create(
+            completion = await self.client.chat.completions.create(
                 model=self.model,
                 temperature=0.4,
                 messages=[
@@ -51,3 +75,33 @@ class AICoach:
         except Exception as exc:
             logger.error("OpenAI request failed: %s", exc)
             return ""
+
+    async def generate_batch(self, system_prompt: str, user_prompts: list[str]) -> list[str]:
+        if not self.enabled or self.client is None:
+            return [""] * len(user_prompts)
+
+        # Users in the same (often empty) state produce identical prompts; ask once per distinct prompt.
+        unique_prompts = list(dict.fromkeys(user_prompts))
+        semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+        async def _generate(user_prompt: str) -> str:
+            async with semaphore:
+                return await self.generate(system_prompt, user_prompt)
+
+        results = await asyncio.gather(*(_generate(prompt) for prompt in unique_prompts))
+        by_prompt = dict(zip(unique_prompts, results))
+        return [by_prompt[prompt] for prompt in user_prompts]
+
+    async def warmup(self) -> None:
+        if not self.enabled or self.client is None:
+            return
+        # Open the TLS connection ahead of the first coaching request so it can reuse it.
+        try:
+            await self.client.models.list()
+        except Exception as exc:
+            logger.warning("OpenAI warmup failed: %s", exc)
+
+    async def aclose(self) -> None:
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+from concurrent.futures import Executor
+from typing import Any, Awaitable, Callable, Optional
+
+from bot.db import MongoStore
+
+
+class AsyncStore:
+    # Awaitable facade over MongoStore: every method runs in an executor thread so
+    # PyMongo round-trips never block the bot's event loop.
+
+    def __init__(self, store: MongoStore, executor: Optional[Executor] = None) -> None:
+        self.sync = store
+        self._executor = executor
+        self._methods: dict[str, Callable[..., Awaitable[Any]]] = {}
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    def __getattr__(self, name: str) -> Callable[..., Awaitable[Any]]:
+        method = self._methods.get(name)
+        if method is not None:
+            return method
+        target = getattr(self.sync, name)
+        if not callable(target):
+            raise AttributeError(f"{type(self.sync).__name__}.{name} is not a method")
+
+        @functools.wraps(target)
+        async def method(*args: Any, **kwargs: Any) -> Any:
+            return await self.run(target, *args, **kwargs)
+
+        self._methods[name] = method
+        return method
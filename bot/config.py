@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import os
 from dataclasses import dataclass
 from pathlib import Path
@@ -9,6 +10,7 @@ from dotenv import load_dotenv
 
 
 _VALID_DAYS = {"mon", "tue", "wed", "thu", "fri", "sat", "sun"}
+_DOTENV_LOADED = False
 
 
 @dataclass(frozen=True)
@@ -26,6 +28,7 @@ class Settings:
     weekly_review_day: str
     weekly_review_hour_utc: int
     stale_task_days: int
+    job_user_concurrency: int
 
 
 def _int_env(name: str, default: int, minimum: int, maximum: int) -> int:
@@ -49,12 +52,22 @@ def _optional_int_env(name: str) -> Optional[int]:
         raise ValueError(f"{name} must be an integer when provided. Got: {raw!r}") from exc
 
 
-def load_settings() -> Settings:
+def _load_dotenv_once() -> None:
+    global _DOTENV_LOADED
+    if _DOTENV_LOADED:
+        return
     custom_env = Path(os.getenv("TODO_ENV_FILE", "~/.config/todo.env")).expanduser()
     if custom_env.is_file():
         load_dotenv(dotenv_path=custom_env, override=False)
     else:
         load_dotenv()
+    _DOTENV_LOADED = True
+
+
+# Settings are immutable for the process lifetime; use load_settings.cache_clear() to re-read.
+@functools.lru_cache(maxsize=1)
+def load_settings() -> Settings:
+    _load_dotenv_once()
 
     telegram_bot_token = os.getenv("TELEGRAM_BOT_TOKEN", "").strip()
     if not telegram_bot_token:
@@ -76,6 +89,7 @@ def load_settings() -> Settings:
         raise ValueError(f"WEEKLY_REVIEW_DAY must be one of {_VALID_DAYS}. Got: {weekly_review_day!r}")
     weekly_review_hour_utc = _int_env("WEEKLY_REVIEW_HOUR_UTC", 17, 0, 23)
     stale_task_days = _int_env("STALE_TASK_DAYS", 7, 1, 365)
+    job_user_concurrency = _int_env("JOB_USER_CONCURRENCY", 16, 1, 100)
 
     return Settings(
         telegram_bot_token=telegram_bot_token,
@@ -91,4 +105,5 @@ def load_settings() -> Settings:
         weekly_review_day=weekly_review_day,
         weekly_review_hour_utc=weekly_review_hour_utc,
         stale_task_days=stale_task_days,
+        job_user_concurrency=job_user_concurrency,
     )
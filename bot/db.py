@@ -1,62 +1,197 @@
 from __future__ import annotations
 
 import calendar
+import functools
+import logging
+import re
+import threading
 from datetime import date, datetime, time, timedelta, timezone
-from typing import Any, Optional
+from time import monotonic
+from typing import Any, Iterable, Iterator, Mapping, NamedTuple, Optional
 
 from bson import ObjectId
 from bson.errors import InvalidId
-from pymongo import ASCENDING, DESCENDING, MongoClient
+from pymongo import ASCENDING, DESCENDING, DeleteOne, MongoClient, ReturnDocument, UpdateOne
+from pymongo.cursor import Cursor
+from pymongo.errors import OperationFailure, PyMongoError
 
 from bot.utils import infer_project_type
 
 
-MAX_AWARE_DT = datetime(9999, 12, 31, tzinfo=timezone.utc)
-LEGACY_COMBINED_CHORE_NAME = "Clean bedroom and bathroom"
-DEFAULT_WEEKEND_CHORES = (
-    {
-        "name": "Water plants",
-        "interval_days": 7,
-        "preferred_weekday": 5,  # Saturday
-    },
-    {
-        "name": "Clean sheets",
-        "interval_days": 21,
-        "preferred_weekday": 5,  # Saturday
-    },
+logger = logging.getLogger(__name__)
+
+# Fields read by task rendering, prompts and the learning profile.
+TODO_LIST_PROJECTION = {
+    "title": 1,
+    "priority": 1,
+    "project_type": 1,
+    "deadline": 1,
+    "created_at": 1,
+    "status": 1,
+    "completed_at": 1,
+}
+# Only the fields a /list task card renders (plus the sort keys it shares).
+TODO_CARD_PROJECTION = {
+    "title": 1,
+    "priority": 1,
+    "project_type": 1,
+    "deadline": 1,
+    "created_at": 1,
+}
+# Task order: priority (normal when unset), then dated before undated, then deadline and age. MongoDB
+# sorts missing values first, so the sort keys on computed fields to keep legacy todos in their place.
+TODO_LIST_SORT_STAGES = [
     {
-        "name": "Clean bedroom",
-        "interval_days": 30,
-        "preferred_weekday": 5,  # Saturday
-    },
-    {
-        "name": "Clean bathroom",
-        "interval_days": 30,
-        "preferred_weekday": 5,  # Saturday
+        "$addFields": {
+            "_priority": {"$ifNull": ["$priority", 2]},
+            "_no_deadline": {"$eq": [{"$ifNull": ["$deadline", None]}, None]},
+        }
     },
+    {"$sort": {"_priority": ASCENDING, "_no_deadline": ASCENDING, "deadline": ASCENDING, "created_at": ASCENDING}},
+]
+_WS_RE = re.compile(r"\s+")
+# Any whitespace other than a single space: tabs, newlines, or a run of spaces.
+_WS_NEEDS_COLLAPSE_RE = re.compile(r"[^\S ]| {2}")
+_DAY_MS = 86_400_000
+PROFILE_CACHE_TTL_SECONDS = 30.0
+PROFILE_CACHE_MAX_SIZE = 10_000
+USER_ID_BATCH_SIZE = 1_000
+JOURNAL_FLUSH_INTERVAL_SECONDS = 0.5
+JOURNAL_FLUSH_BATCH_SIZE = 32
+# Cached coaching messages are keyed by day; MongoDB's TTL monitor purges old days.
+COACHING_CACHE_RETENTION_SECONDS = 2 * 86_400
+COACHING_EPOCHS_MAX_SIZE = 10_000
+CHORE_PROJECTION = {
+    "name": 1,
+    "interval_days": 1,
+    "preferred_weekday": 1,
+    "next_due_date": 1,
+    "last_completed_at": 1,
+}
+PENDING_REFLECTION_SORT = [("asked_at", ASCENDING), ("question_key", ASCENDING)]
+LEGACY_COMBINED_CHORE_NAME = "Clean bedroom and bathroom"
+
+
+class _Chore(NamedTuple):
+    name: str
+    interval_days: int
+    preferred_weekday: int
+
+
+DEFAULT_WEEKEND_CHORES = (
+    _Chore(name="Water plants", interval_days=7, preferred_weekday=5),  # Saturday
+    _Chore(name="Clean sheets", interval_days=21, preferred_weekday=5),  # Saturday
+    _Chore(name="Clean bedroom", interval_days=30, preferred_weekday=5),  # Saturday
+    _Chore(name="Clean bathroom", interval_days=30, preferred_weekday=5),  # Saturday
 )
 
 
+# Bump when DEFAULT_WEEKEND_CHORES or the legacy migration changes so users are re-seeded.
+DEFAULT_CHORES_VERSION = 2
+# Bump whenever _ensure_indexes gains an index or migration step.
+INDEXES_VERSION = 5
+
+
+class CoachingBundle(NamedTuple):
+    active_todos: list[dict[str, Any]]
+    completed_todos: list[dict[str, Any]]
+    stale_todos: list[dict[str, Any]]
+    overdue_todos: list[dict[str, Any]]
+    stats: dict[str, int]
+    recent_notes: list[str]
+    recent_reflections: list[str]
+
+
 class MongoStore:
+    # (uri, db_name) pairs whose indexes were already ensured by this process.
+    _indexed_databases: set[tuple[str, str]] = set()
+
     def __init__(self, uri: str, db_name: str) -> None:
-        self.client = MongoClient(uri, tz_aware=True)
+        self.client = MongoClient(
+            uri,
+            tz_aware=True,
+            # Decode as timezone.utc (not bson's own UTC tzinfo) so to_utc can skip astimezone.
+            tzinfo=timezone.utc,
+            maxPoolSize=50,
+            minPoolSize=5,
+            maxIdleTimeMS=60_000,
+            waitQueueTimeoutMS=2_500,
+            serverSelectionTimeoutMS=5_000,
+            retryWrites=True,
+            w=1,
+            # zlib ships with Python; zstd/snappy would need extra packages and warn when missing.
+            compressors="zlib",
+        )
         self.db = self.client[db_name]
         self.users = self.db.users
         self.todos = self.db.todos
         self.recurring_chores = self.db.recurring_chores
         self.daily_reflections = self.db.daily_reflections
         self.journal_entries = self.db.journal_entries
-        self._ensure_indexes()
+        self.coaching_cache = self.db.coaching_cache
+        self._journal_buffer: list[dict[str, Any]] = []
+        self._journal_lock = threading.Lock()
+        # Held across the insert so a reader's flush returns only after every earlier batch is acknowledged.
+        self._journal_flush_lock = threading.Lock()
+        self._journal_timer: Optional[threading.Timer] = None
+        self._profile_cache: dict[int, tuple[float, dict[str, Any]]] = {}
+        self._profile_cache_lock = threading.Lock()
+        # user_id -> epoch of the user's last coaching invalidation; lets a slow generation detect it
+        # went stale. Epochs come from one increasing counter, and evicted users fall back to the
+        # highest evicted epoch, so an eviction can only make a pending write look stale, never fresh.
+        self._coaching_epochs: dict[int, int] = {}
+        self._coaching_epoch_counter = 0
+        self._coaching_epoch_floor = 0
+        # Held across the epoch check and the cache write/delete so an invalidation cannot slip between them.
+        self._coaching_lock = threading.Lock()
+        self.schema_meta = self.db.schema_meta
+        if (uri, db_name) not in MongoStore._indexed_databases:
+            self._ensure_schema()
+            MongoStore._indexed_databases.add((uri, db_name))
 
     def ping(self) -> None:
         self.client.admin.command("ping")
 
+    def _ensure_schema(self) -> None:
+        # Indexes and migrations only need to run once per INDEXES_VERSION, not per process start.
+        meta = self.schema_meta.find_one({"_id": "indexes_v"}, projection={"v": 1})
+        if meta and meta.get("v", 0) >= INDEXES_VERSION:
+            return
+        self._ensure_indexes()
+        self.schema_meta.update_one(
+            {"_id": "indexes_v"},
+            {"$max": {"v": INDEXES_VERSION}, "$set": {"updated_at": datetime.now(timezone.utc)}},
+            upsert=True,
+        )
+
     def _ensure_indexes(self) -> None:
         self.users.create_index([("user_id", ASCENDING)], unique=True)
-        self.todos.create_index([("user_id", ASCENDING), ("status", ASCENDING), ("priority", ASCENDING)])
+        # Replaced by the wider task-page index below, which serves the same (user_id, status) prefix.
+        for index in self.todos.list_indexes():
+            if list(index.get("key", {}).items()) == [("user_id", 1), ("status", 1), ("priority", 1)]:
+                self.todos.drop_index(index["name"])
+                break
+        # Serves the (user_id, status) match of task pages. The sort itself runs in memory on the
+        # matched todos, since it keys on computed fields that no index can provide.
+        self.todos.create_index(
+            [
+                ("user_id", ASCENDING),
+                ("status", ASCENDING),
+                ("priority", ASCENDING),
+                ("deadline", ASCENDING),
+                ("created_at", ASCENDING),
+            ]
+        )
         self.todos.create_index([("user_id", ASCENDING), ("status", ASCENDING), ("project_type", ASCENDING)])
         self.todos.create_index([("user_id", ASCENDING), ("created_at", DESCENDING)])
         self.todos.create_index([("user_id", ASCENDING), ("deadline", ASCENDING)])
+        self.todos.create_index([("user_id", ASCENDING), ("status", ASCENDING), ("deadline", ASCENDING)])
+        # Only completed todos carry completed_at; keeps done_7d/done_30d stats and
+        # completion history reads bounded to the recent window.
+        self.todos.create_index(
+            [("user_id", ASCENDING), ("completed_at", DESCENDING)],
+            partialFilterExpression={"status": "done"},
+        )
         self.recurring_chores.create_index([("user_id", ASCENDING), ("name", ASCENDING)], unique=True)
         self.recurring_chores.create_index([("user_id", ASCENDING), ("next_due_date", ASCENDING)])
         # Migrate from single-question-per-day index to per-question-per-day index.
@@ -70,12 +205,22 @@ class MongoStore:
             unique=True,
         )
         self.daily_reflections.create_index([("user_id", ASCENDING), ("asked_at", DESCENDING)])
+        # Backfill skipped so pending lookups can use equality instead of {"$ne": True}.
+        self.daily_reflections.update_many({"skipped": {"$nin": [True, False]}}, {"$set": {"skipped": False}})
+        self.daily_reflections.create_index(
+            [("user_id", ASCENDING), ("skipped", ASCENDING), ("answer", ASCENDING), ("asked_at", ASCENDING)]
+        )
         self.daily_reflections.create_index([("user_id", ASCENDING), ("answered_at", DESCENDING)])
         self.journal_entries.create_index([("user_id", ASCENDING), ("created_at", DESCENDING)])
+        self.coaching_cache.create_index(
+            [("user_id", ASCENDING), ("kind", ASCENDING), ("for_date", ASCENDING)],
+            unique=True,
+        )
+        self.coaching_cache.create_index("created_at", expireAfterSeconds=COACHING_CACHE_RETENTION_SECONDS)
 
     def upsert_user(self, user_id: int, username: str, first_name: str) -> dict[str, Any]:
         now = datetime.now(timezone.utc)
-        self.users.update_one(
+        profile = self.users.find_one_and_update(
             {"user_id": user_id},
             {
                 "$set": {
@@ -89,18 +234,56 @@ class MongoStore:
                 },
             },
             upsert=True,
+            return_document=ReturnDocument.AFTER,
         )
-        self.ensure_default_chores(user_id)
-        return self.get_user_profile(user_id)
+        # Returning users already have the current chore set; only seed new or outdated users.
+        if profile.get("default_chores_version") != DEFAULT_CHORES_VERSION:
+            self.ensure_default_chores(user_id)
+            profile["default_chores_version"] = DEFAULT_CHORES_VERSION
+        if "main_goal" not in profile:
+            profile["main_goal"] = "make money"
+        self._cache_profile(user_id, profile)
+        return profile
 
-    def get_user_profile(self, user_id: int) -> dict[str, Any]:
-        profile = self.users.find_one({"user_id": user_id}) or {}
+    def get_user_profile(self, user_id: int, fields: Optional[Iterable[str]] = None) -> dict[str, Any]:
+        cached = self._cached_profile(user_id)
+        if cached is not None:
+            return cached
+        projection = {field: 1 for field in fields} if fields is not None else None
+        profile = self.users.find_one({"user_id": user_id}, projection=projection) or {}
         if "main_goal" not in profile:
             profile["main_goal"] = "make money"
+        if projection is None:
+            self._cache_profile(user_id, profile)
         return profile
 
-    def list_user_ids(self) -> list[int]:
-        return [doc["user_id"] for doc in self.users.find({}, {"_id": 0, "user_id": 1})]
+    def _cached_profile(self, user_id: int) -> Optional[dict[str, Any]]:
+        with self._profile_cache_lock:
+            entry = self._profile_cache.get(user_id)
+            if entry is None:
+                return None
+            expires_at, profile = entry
+            if expires_at < monotonic():
+                del self._profile_cache[user_id]
+                return None
+            return dict(profile)
+
+    def _cache_profile(self, user_id: int, profile: dict[str, Any]) -> None:
+        # Short-lived cache: repeated profile reads within a few seconds skip MongoDB.
+        with self._profile_cache_lock:
+            if user_id not in self._profile_cache and len(self._profile_cache) >= PROFILE_CACHE_MAX_SIZE:
+                self._profile_cache.pop(next(iter(self._profile_cache)))
+            self._profile_cache[user_id] = (monotonic() + PROFILE_CACHE_TTL_SECONDS, dict(profile))
+
+    def _invalidate_profile(self, user_id: int) -> None:
+        with self._profile_cache_lock:
+            self._profile_cache.pop(user_id, None)
+
+    def iter_user_ids(self) -> Iterator[int]:
+        # Hinting the unique user_id index makes this an index-only (covered) scan.
+        cursor = self.users.find({}, {"_id": 0, "user_id": 1}, batch_size=USER_ID_BATCH_SIZE)
+        for doc in cursor.hint([("user_id", ASCENDING)]):
+            yield doc["user_id"]
 
     def set_main_goal(self, user_id: int, main_goal: str) -> None:
         self.users.update_one(
@@ -113,108 +296,152 @@ class MongoStore:
             },
             upsert=True,
         )
+        self._invalidate_profile(user_id)
+        self.invalidate_cached_coaching(user_id)
+
+    def get_cached_coaching(self, user_id: int, kind: str, for_date: date) -> Optional[str]:
+        doc = self.coaching_cache.find_one(
+            {"user_id": user_id, "kind": kind, "for_date": for_date.isoformat()},
+            projection={"_id": 0, "message": 1},
+        )
+        return doc.get("message") if doc else None
+
+    def coaching_epoch(self, user_id: int) -> int:
+        with self._coaching_lock:
+            return self._coaching_epochs.get(user_id, self._coaching_epoch_floor)
+
+    def set_cached_coaching(
+        self, user_id: int, kind: str, for_date: date, message: str, epoch: Optional[int] = None
+    ) -> None:
+        # Skip the write when the user's tasks changed while the message was being generated.
+        with self._coaching_lock:
+            if epoch is not None and epoch != self._coaching_epochs.get(user_id, self._coaching_epoch_floor):
+                return
+            self.coaching_cache.update_one(
+                {"user_id": user_id, "kind": kind, "for_date": for_date.isoformat()},
+                {"$set": {"message": message, "created_at": datetime.now(timezone.utc)}},
+                upsert=True,
+            )
+
+    def invalidate_cached_coaching(self, user_id: int) -> None:
+        # Coaching is derived from the task list; drop it whenever tasks or the goal change. Acknowledged,
+        # so a read or write issued after this call cannot be ordered ahead of the delete.
+        with self._coaching_lock:
+            self._coaching_epoch_counter += 1
+            self._coaching_epochs.pop(user_id, None)
+            if len(self._coaching_epochs) >= COACHING_EPOCHS_MAX_SIZE:
+                evicted = self._coaching_epochs.pop(next(iter(self._coaching_epochs)))
+                self._coaching_epoch_floor = max(self._coaching_epoch_floor, evicted)
+            self._coaching_epochs[user_id] = self._coaching_epoch_counter
+            self.coaching_cache.delete_many({"user_id": user_id})
 
     def ensure_default_chores(self, user_id: int) -> None:
         now = datetime.now(timezone.utc)
         today = now.date()
-        legacy = self.recurring_chores.find_one({"user_id": user_id, "name": LEGACY_COMBINED_CHORE_NAME})
+        legacy = self.recurring_chores.find_one(
+            {"user_id": user_id, "name": LEGACY_COMBINED_CHORE_NAME},
+            projection={"next_due_date": 1, "last_completed_at": 1},
+        )
         legacy_next_due = legacy.get("next_due_date") if legacy else None
         legacy_last_completed = legacy.get("last_completed_at") if legacy else None
+
+        operations: list[Any] = []
         if legacy:
-            self.recurring_chores.delete_one({"_id": legacy["_id"], "user_id": user_id})
-
-        for chore in DEFAULT_WEEKEND_CHORES:
-            name = chore["name"]
-            interval_days = int(chore["interval_days"])
-            preferred_weekday = int(chore["preferred_weekday"])
-            first_due_date = _next_weekday_on_or_after(today, preferred_weekday)
-            default_next_due = _at_start_of_day_utc(first_due_date)
+            operations.append(DeleteOne({"_id": legacy["_id"], "user_id": user_id}))
+        first_due_by_weekday: dict[int, datetime] = {}
+        for name, interval_days, preferred_weekday in DEFAULT_WEEKEND_CHORES:
+            default_next_due = first_due_by_weekday.get(preferred_weekday)
+            if default_next_due is None:
+                default_next_due = _at_start_of_day_utc(_next_weekday_on_or_after(today, preferred_weekday))
+                first_due_by_weekday[preferred_weekday] = default_next_due
             next_due_seed = legacy_next_due if isinstance(legacy_next_due, datetime) else default_next_due
-            self.recurring_chores.update_one(
-                {"user_id": user_id, "name": name},
-                {
-                    "$setOnInsert": {
-                        "user_id": user_id,
-                        "name": name,
-                        "interval_days": interval_days,
-                        "preferred_weekday": preferred_weekday,
-                        "next_due_date": next_due_seed,
-                        "created_at": now,
-                        "updated_at": now,
-                        "last_completed_at": legacy_last_completed,
+            operations.append(
+                UpdateOne(
+                    {"user_id": user_id, "name": name},
+                    {
+                        "$setOnInsert": {
+                            "user_id": user_id,
+                            "name": name,
+                            "interval_days": interval_days,
+                            "preferred_weekday": preferred_weekday,
+                            "next_due_date": next_due_seed,
+                            "created_at": now,
+                            "updated_at": now,
+                            "last_completed_at": legacy_last_completed,
+                        },
                     },
-                },
-                upsert=True,
+                    upsert=True,
+                )
             )
+        self.recurring_chores.bulk_write(operations, ordered=False)
+        self.users.update_one({"user_id": user_id}, {"$set": {"default_chores_version": DEFAULT_CHORES_VERSION}})
+
+    def ensure_current_default_chores(self, user_id: int) -> None:
+        # Jobs reach users who may not have chatted since the chore set changed; everyone else is
+        # already seeded by upsert_user, so this costs one (usually cached) profile read.
+        profile = self.get_user_profile(user_id, fields=("default_chores_version",))
+        if profile.get("default_chores_version") == DEFAULT_CHORES_VERSION:
+            return
+        self.ensure_default_chores(user_id)
+        self._invalidate_profile(user_id)
 
     def list_chores(self, user_id: int, limit: int = 25) -> list[dict[str, Any]]:
         return list(
-            self.recurring_chores.find({"user_id": user_id}).sort(
+            self.recurring_chores.find({"user_id": user_id}, projection=CHORE_PROJECTION).sort(
                 [("next_due_date", ASCENDING), ("name", ASCENDING)]
             ).limit(limit)
         )
 
-    def ensure_daily_reflection_prompt(
+    def ensure_daily_reflection_prompts_bulk(
         self,
         user_id: int,
-        question_key: str,
-        question: str,
+        questions: Iterable[Mapping[str, str]],
         asked_at: Optional[datetime] = None,
-    ) -> bool:
+    ) -> list[str]:
         now = asked_at or datetime.now(timezone.utc)
         date_key = now.date().isoformat()
-        result = self.daily_reflections.update_one(
-            {
-                "user_id": user_id,
-                "asked_for_date": date_key,
-                "question_key": question_key,
-            },
-            {
-                "$setOnInsert": {
-                    "user_id": user_id,
-                    "question_key": question_key,
-                    "question": question.strip(),
-                    "asked_for_date": date_key,
-                    "asked_at": now,
-                    "answer": None,
-                    "answered_at": None,
-                    "skipped": False,
-                    "skipped_at": None,
-                    "skip_note": None,
-                }
-            },
-            upsert=True,
-        )
-        return result.upserted_id is not None
-
-    def get_pending_reflections(self, user_id: int, limit: int = 5) -> list[dict[str, Any]]:
-        return list(
-            self.daily_reflections.find(
-                {
-                    "user_id": user_id,
-                    "answer": None,
-                    "skipped": {"$ne": True},
-                }
+        question_keys: list[str] = []
+        operations: list[Any] = []
+        for question in questions:
+            question_keys.append(question["key"])
+            operations.append(
+                UpdateOne(
+                    {
+                        "user_id": user_id,
+                        "asked_for_date": date_key,
+                        "question_key": question["key"],
+                    },
+                    {
+                        "$setOnInsert": {
+                            "user_id": user_id,
+                            "question_key": question["key"],
+                            "question": question["text"].strip(),
+                            "asked_for_date": date_key,
+                            "asked_at": now,
+                            "answer": None,
+                            "answered_at": None,
+                            "skipped": False,
+                            "skipped_at": None,
+                            "skip_note": None,
+                        }
+                    },
+                    upsert=True,
+                )
             )
-            .sort([("asked_at", ASCENDING), ("question_key", ASCENDING)])
-            .limit(limit)
-        )
-
-    def get_pending_reflection(self, user_id: int) -> Optional[dict[str, Any]]:
-        pending = self.get_pending_reflections(user_id=user_id, limit=1)
-        return pending[0] if pending else None
-
-    def save_pending_reflection_answer(self, user_id: int, answer: str) -> bool:
-        pending = self.get_pending_reflection(user_id)
-        if not pending:
-            return False
-
-        cleaned = " ".join(answer.split())
+        if not operations:
+            return []
+        # One round-trip for every question; upserted_ids is keyed by operation index.
+        result = self.daily_reflections.bulk_write(operations, ordered=False)
+        return [question_keys[index] for index in sorted(result.upserted_ids)]
+
+    def save_pending_reflection_answer(self, user_id: int, answer: str) -> Optional[dict[str, Any]]:
+        cleaned = _normalize_ws(answer)
         if not cleaned:
-            return False
+            return None
 
-        result = self.daily_reflections.update_one(
-            {"_id": pending["_id"], "user_id": user_id, "answer": None},
+        # Claim and answer the oldest pending prompt in one atomic round-trip.
+        answered = self.daily_reflections.find_one_and_update(
+            _pending_reflection_filter(user_id),
             {
                 "$set": {
                     "answer": cleaned[:4000],
@@ -224,36 +451,48 @@ class MongoStore:
                     "skip_note": None,
                 }
             },
+            sort=PENDING_REFLECTION_SORT,
+            projection={"_id": 1, "question": 1},
         )
-        return result.modified_count == 1
+        # The claimed prompt (or None), so callers learn which question was answered.
+        return answered
 
     def pass_pending_reflection(self, user_id: int, skip_note: str = "pass") -> bool:
-        pending = self.get_pending_reflection(user_id)
-        if not pending:
-            return False
-
-        result = self.daily_reflections.update_one(
-            {"_id": pending["_id"], "user_id": user_id, "answer": None},
+        now = datetime.now(timezone.utc)
+        skipped = self.daily_reflections.find_one_and_update(
+            _pending_reflection_filter(user_id),
             {
                 "$set": {
                     "answer": "",
-                    "answered_at": datetime.now(timezone.utc),
+                    "answered_at": now,
                     "skipped": True,
-                    "skipped_at": datetime.now(timezone.utc),
+                    "skipped_at": now,
                     "skip_note": skip_note[:120],
                 }
             },
+            sort=PENDING_REFLECTION_SORT,
+            projection={"_id": 1},
         )
-        return result.modified_count == 1
+        return skipped is not None
 
-    def count_pending_reflections(self, user_id: int) -> int:
-        return self.daily_reflections.count_documents(
+    def get_pending_reflection_with_count(self, user_id: int, limit: int = 2) -> tuple[list[dict[str, Any]], int]:
+        # Oldest pending prompts and the pending count from one index scan and one round-trip.
+        pipeline = [
+            {"$match": _pending_reflection_filter(user_id)},
             {
-                "user_id": user_id,
-                "answer": None,
-                "skipped": {"$ne": True},
-            }
-        )
+                "$facet": {
+                    "first": [{"$sort": dict(PENDING_REFLECTION_SORT)}, {"$limit": limit}],
+                    "count": [{"$count": "n"}],
+                }
+            },
+        ]
+        result = next(self.daily_reflections.aggregate(pipeline), None) or {}
+        count = result.get("count") or [{"n": 0}]
+        return list(result.get("first") or []), int(count[0]["n"])
+
+    def peek_pending_reflections(self, user_id: int) -> tuple[Optional[dict[str, Any]], int]:
+        pending, count = self.get_pending_reflection_with_count(user_id, limit=1)
+        return (pending[0] if pending else None), count
 
     def get_recent_reflection_answers(self, user_id: int, limit: int = 12) -> list[str]:
         return [
@@ -262,8 +501,9 @@ class MongoStore:
                 {
                     "user_id": user_id,
                     "answer": {"$nin": [None, ""]},
-                    "skipped": {"$ne": True},
-                }
+                    "skipped": False,
+                },
+                projection={"_id": 0, "answer": 1},
             )
             .sort("answered_at", DESCENDING)
             .limit(limit)
@@ -271,43 +511,46 @@ class MongoStore:
 
     def list_due_chores(self, user_id: int, on_date: Optional[date] = None, limit: int = 25) -> list[dict[str, Any]]:
         day = on_date or datetime.now(timezone.utc).date()
-        due_until = _at_end_of_day_utc(day)
-        return list(
+        due_before = _at_start_of_day_utc(day + timedelta(days=1))
+        cursor = (
             self.recurring_chores.find(
                 {
                     "user_id": user_id,
-                    "next_due_date": {"$lte": due_until},
+                    "next_due_date": {"$lt": due_before},
                 }
-            ).sort([("next_due_date", ASCENDING), ("interval_days", ASCENDING)]).limit(limit)
+            )
+            .sort([("next_due_date", ASCENDING), ("interval_days", ASCENDING)])
+            .limit(limit)
         )
+        return _fetch_hinted(cursor, [("user_id", ASCENDING), ("next_due_date", ASCENDING)])
 
     def mark_chore_done(self, user_id: int, chore_id: str, completed_at: Optional[datetime] = None) -> Optional[dict[str, Any]]:
         object_id = _safe_object_id(chore_id)
         if not object_id:
             return None
 
-        chore = self.recurring_chores.find_one({"_id": object_id, "user_id": user_id})
-        if not chore:
-            return None
-
         now = completed_at or datetime.now(timezone.utc)
-        done_date = now.date()
-        interval_days = int(chore.get("interval_days", 7))
-        preferred_weekday = int(chore.get("preferred_weekday", 5))
-        raw_next_due = done_date + timedelta(days=interval_days)
-        next_due_date = _next_weekday_on_or_after(raw_next_due, preferred_weekday)
-
-        self.recurring_chores.update_one(
+        # next due = (done day + interval_days) snapped to preferred_weekday, computed
+        # by the server from the stored chore so no prior read is needed.
+        raw_next_due = {
+            "$add": [
+                _at_start_of_day_utc(now.date()),
+                {"$multiply": [{"$ifNull": ["$interval_days", 7]}, _DAY_MS]},
+            ]
+        }
+        return self.recurring_chores.find_one_and_update(
             {"_id": object_id, "user_id": user_id},
-            {
-                "$set": {
-                    "last_completed_at": now,
-                    "next_due_date": _at_start_of_day_utc(next_due_date),
-                    "updated_at": now,
+            [
+                {
+                    "$set": {
+                        "last_completed_at": now,
+                        "next_due_date": _next_weekday_on_or_after_expr(raw_next_due),
+                        "updated_at": now,
+                    }
                 }
-            },
+            ],
+            return_document=ReturnDocument.AFTER,
         )
-        return self.recurring_chores.find_one({"_id": object_id, "user_id": user_id})
 
     def postpone_chore_to_next_weekend(
         self, user_id: int, chore_id: str, passed_at: Optional[datetime] = None
@@ -316,29 +559,25 @@ class MongoStore:
         if not object_id:
             return None
 
-        chore = self.recurring_chores.find_one({"_id": object_id, "user_id": user_id})
-        if not chore:
-            return None
-
         now = passed_at or datetime.now(timezone.utc)
-        preferred_weekday = int(chore.get("preferred_weekday", 5))
-        next_due_date = _next_weekday_on_or_after(now.date() + timedelta(days=1), preferred_weekday)
-
-        self.recurring_chores.update_one(
+        tomorrow = _at_start_of_day_utc(now.date() + timedelta(days=1))
+        return self.recurring_chores.find_one_and_update(
             {"_id": object_id, "user_id": user_id},
-            {
-                "$set": {
-                    "next_due_date": _at_start_of_day_utc(next_due_date),
-                    "updated_at": now,
+            [
+                {
+                    "$set": {
+                        "next_due_date": _next_weekday_on_or_after_expr(tomorrow),
+                        "updated_at": now,
+                    }
                 }
-            },
+            ],
+            return_document=ReturnDocument.AFTER,
         )
-        return self.recurring_chores.find_one({"_id": object_id, "user_id": user_id})
 
     def add_todo(self, user_id: int, title: str, priority: int, deadline: Optional[datetime]) -> dict[str, Any]:
         now = datetime.now(timezone.utc)
         cleaned_title = title.strip()
-        resolved_deadline = deadline if deadline is not None else _default_deadline_one_month(now)
+        resolved_deadline = deadline if deadline is not None else default_deadline_one_month(now)
         doc = {
             "user_id": user_id,
             "title": cleaned_title,
@@ -352,120 +591,239 @@ class MongoStore:
         }
         result = self.todos.insert_one(doc)
         doc["_id"] = result.inserted_id
+        self.invalidate_cached_coaching(user_id)
         return doc
 
-    def _sort_todos(self, todos: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        return sorted(
-            todos,
-            key=lambda todo: (
-                todo.get("priority", 2),
-                todo.get("deadline") is None,
-                todo.get("deadline") or MAX_AWARE_DT,
-                todo.get("created_at") or MAX_AWARE_DT,
-            ),
-        )
-
-    def list_active_todos(self, user_id: int, limit: int = 50) -> list[dict[str, Any]]:
-        todos = list(self.todos.find({"user_id": user_id, "status": "active"}))
-        return self._sort_todos(todos)[:limit]
-
-    def get_recent_completed_todos(self, user_id: int, days: int = 120, limit: int = 300) -> list[dict[str, Any]]:
-        threshold = datetime.now(timezone.utc) - timedelta(days=days)
-        return list(
-            self.todos.find(
-                {
-                    "user_id": user_id,
-                    "status": "done",
-                    "completed_at": {"$gte": threshold},
-                }
-            )
-            .sort("completed_at", DESCENDING)
-            .limit(limit)
-        )
-
-    def get_stale_todos(self, user_id: int, stale_days: int, limit: int = 10) -> list[dict[str, Any]]:
-        threshold = datetime.now(timezone.utc) - timedelta(days=stale_days)
-        todos = list(
-            self.todos.find(
-                {
-                    "user_id": user_id,
-                    "status": "active",
-                    "created_at": {"$lte": threshold},
-                }
-            )
-        )
-        return self._sort_todos(todos)[:limit]
+    def _find_sorted_todos(
+        self,
+        query: dict[str, Any],
+        limit: int,
+        projection: Optional[dict[str, Any]] = None,
+    ) -> list[dict[str, Any]]:
+        # Sort and limit on the server so the page holds exactly the todos shown, in display order.
+        pipeline = [
+            {"$match": query},
+            *TODO_LIST_SORT_STAGES,
+            {"$limit": limit},
+            {"$project": projection or TODO_LIST_PROJECTION},
+        ]
+        return list(self.todos.aggregate(pipeline))
 
-    def get_overdue_todos(self, user_id: int, limit: int = 10) -> list[dict[str, Any]]:
-        now = datetime.now(timezone.utc)
-        todos = list(
-            self.todos.find(
-                {
-                    "user_id": user_id,
-                    "status": "active",
-                    "deadline": {"$ne": None, "$lt": now},
-                }
-            )
-        )
-        return self._sort_todos(todos)[:limit]
+    def list_active_todos(
+        self, user_id: int, limit: int = 50, projection: Optional[dict[str, Any]] = None
+    ) -> list[dict[str, Any]]:
+        return self._find_sorted_todos({"user_id": user_id, "status": "active"}, limit=limit, projection=projection)
 
     def mark_todo_done(self, user_id: int, todo_id: str) -> bool:
         object_id = _safe_object_id(todo_id)
         if not object_id:
             return False
+        now = datetime.now(timezone.utc)
         result = self.todos.update_one(
             {"_id": object_id, "user_id": user_id, "status": "active"},
             {
                 "$set": {
                     "status": "done",
-                    "completed_at": datetime.now(timezone.utc),
-                    "updated_at": datetime.now(timezone.utc),
+                    "completed_at": now,
+                    "updated_at": now,
                 }
             },
         )
-        return result.modified_count == 1
+        if result.modified_count != 1:
+            return False
+        self.invalidate_cached_coaching(user_id)
+        return True
 
     def delete_todo(self, user_id: int, todo_id: str) -> bool:
         object_id = _safe_object_id(todo_id)
         if not object_id:
             return False
         result = self.todos.delete_one({"_id": object_id, "user_id": user_id})
-        return result.deleted_count == 1
+        if result.deleted_count != 1:
+            return False
+        self.invalidate_cached_coaching(user_id)
+        return True
 
     def add_journal_entry(self, user_id: int, text: str, source: str = "chat") -> None:
-        cleaned = " ".join(text.split())
+        cleaned = _normalize_ws(text)
         if not cleaned:
             return
-        self.journal_entries.insert_one(
-            {
-                "user_id": user_id,
-                "text": cleaned[:1200],
-                "source": source,
-                "created_at": datetime.now(timezone.utc),
-            }
-        )
+        entry = {
+            "user_id": user_id,
+            "text": cleaned[:1200],
+            "source": source,
+            "created_at": datetime.now(timezone.utc),
+        }
+        # Entries are buffered and written with insert_many, either once the batch
+        # fills up or after a short delay, so chat handlers don't wait on a round-trip.
+        with self._journal_lock:
+            self._journal_buffer.append(entry)
+            flush_now = len(self._journal_buffer) >= JOURNAL_FLUSH_BATCH_SIZE
+            if not flush_now and self._journal_timer is None:
+                self._journal_timer = threading.Timer(JOURNAL_FLUSH_INTERVAL_SECONDS, self.flush_journal)
+                self._journal_timer.daemon = True
+                self._journal_timer.start()
+        if flush_now:
+            self.flush_journal()
+
+    def flush_journal(self) -> None:
+        # Flushes run on the timer thread or in an executor, never on the event loop, so the
+        # acknowledged write costs no handler latency and lets readers see every buffered note.
+        with self._journal_flush_lock:
+            with self._journal_lock:
+                batch = self._journal_buffer
+                self._journal_buffer = []
+                timer = self._journal_timer
+                self._journal_timer = None
+            if timer is not None:
+                timer.cancel()
+            if not batch:
+                return
+            try:
+                self.journal_entries.insert_many(batch, ordered=False)
+            except PyMongoError as exc:
+                logger.error("Failed to write %s journal entries: %s", len(batch), exc)
 
     def get_recent_journal_entries(self, user_id: int, limit: int = 12) -> list[str]:
+        self.flush_journal()
         return [
             entry["text"]
-            for entry in self.journal_entries.find({"user_id": user_id}).sort("created_at", DESCENDING).limit(limit)
+            for entry in self.journal_entries.find({"user_id": user_id}, projection={"_id": 0, "text": 1})
+            .sort("created_at", DESCENDING)
+            .limit(limit)
         ]
 
-    def get_stats(self, user_id: int) -> dict[str, int]:
+    def get_coaching_bundle(
+        self,
+        user_id: int,
+        *,
+        active_limit: int,
+        completed_days: int,
+        completed_limit: int,
+        stale_days: int,
+        stale_limit: int,
+        overdue_limit: int,
+        notes_limit: int,
+        reflections_limit: int,
+    ) -> CoachingBundle:
+        # Everything the coach reads from todos comes back from one $facet round-trip instead of five queries.
         now = datetime.now(timezone.utc)
-        last_7 = now - timedelta(days=7)
         last_30 = now - timedelta(days=30)
-        return {
-            "active": self.todos.count_documents({"user_id": user_id, "status": "active"}),
-            "done_7d": self.todos.count_documents(
-                {"user_id": user_id, "status": "done", "completed_at": {"$gte": last_7}}
-            ),
-            "done_30d": self.todos.count_documents(
-                {"user_id": user_id, "status": "done", "completed_at": {"$gte": last_30}}
-            ),
-            "created_7d": self.todos.count_documents({"user_id": user_id, "created_at": {"$gte": last_7}}),
-            "created_30d": self.todos.count_documents({"user_id": user_id, "created_at": {"$gte": last_30}}),
+        completed_since = now - timedelta(days=completed_days)
+        project_stage = {"$project": TODO_LIST_PROJECTION}
+        pipeline = [
+            # $facet sub-pipelines cannot use indexes, so narrow to the todos some facet reads first:
+            # each branch is served by an index, and old finished todos never leave the server.
+            {
+                "$match": {
+                    "user_id": user_id,
+                    "$or": [
+                        {"status": "active"},
+                        {"status": "done", "completed_at": {"$gte": min(completed_since, last_30)}},
+                        {"created_at": {"$gte": last_30}},
+                    ],
+                }
+            },
+            {
+                "$facet": {
+                    "active": [
+                        {"$match": {"status": "active"}},
+                        *TODO_LIST_SORT_STAGES,
+                        {"$limit": active_limit},
+                        project_stage,
+                    ],
+                    "stale": [
+                        {"$match": {"status": "active", "created_at": {"$lte": now - timedelta(days=stale_days)}}},
+                        *TODO_LIST_SORT_STAGES,
+                        {"$limit": stale_limit},
+                        project_stage,
+                    ],
+                    "overdue": [
+                        {"$match": {"status": "active", "deadline": {"$ne": None, "$lt": now}}},
+                        *TODO_LIST_SORT_STAGES,
+                        {"$limit": overdue_limit},
+                        project_stage,
+                    ],
+                    "completed": [
+                        {"$match": {"status": "done", "completed_at": {"$gte": completed_since}}},
+                        {"$sort": {"completed_at": DESCENDING}},
+                        {"$limit": completed_limit},
+                        {"$project": {"_id": 0, "project_type": 1, "created_at": 1, "completed_at": 1}},
+                    ],
+                    "stats": [_stats_group_stage(now)],
+                }
+            },
+        ]
+        facets = next(self.todos.aggregate(pipeline), {})
+        stats = facets.get("stats") or [None]
+        return CoachingBundle(
+            active_todos=facets.get("active", []),
+            completed_todos=facets.get("completed", []),
+            stale_todos=facets.get("stale", []),
+            overdue_todos=facets.get("overdue", []),
+            stats=_stats_from_group(stats[0]),
+            recent_notes=self.get_recent_journal_entries(user_id, limit=notes_limit),
+            recent_reflections=self.get_recent_reflection_answers(user_id, limit=reflections_limit),
+        )
+
+
+@functools.lru_cache(maxsize=8)
+def get_store(uri: str, db_name: str) -> MongoStore:
+    # Always go through this factory: each MongoStore owns a MongoClient pool, so
+    # constructing stores directly would churn connections.
+    return MongoStore(uri=uri, db_name=db_name)
+
+
+_STATS_FIELDS = ("active", "done_7d", "done_30d", "created_7d", "created_30d")
+
+
+def _stats_group_stage(now: datetime) -> dict[str, Any]:
+    last_7 = now - timedelta(days=7)
+    last_30 = now - timedelta(days=30)
+    is_done = {"$eq": ["$status", "done"]}
+    conditions = {
+        "active": {"$eq": ["$status", "active"]},
+        "done_7d": {"$and": [is_done, {"$gte": ["$completed_at", last_7]}]},
+        "done_30d": {"$and": [is_done, {"$gte": ["$completed_at", last_30]}]},
+        "created_7d": {"$gte": ["$created_at", last_7]},
+        "created_30d": {"$gte": ["$created_at", last_30]},
+    }
+    # One $group pass with conditional sums instead of a sub-pipeline per counter.
+    return {
+        "$group": {
+            "_id": None,
+            **{name: {"$sum": {"$cond": [conditions[name], 1, 0]}} for name in _STATS_FIELDS},
         }
+    }
+
+
+def _stats_from_group(result: Optional[Mapping[str, Any]]) -> dict[str, int]:
+    result = result or {}
+    return {name: int(result.get(name, 0)) for name in _STATS_FIELDS}
+
+
+def _fetch_hinted(cursor: Cursor, hint: list[tuple[str, int]]) -> list[dict[str, Any]]:
+    # Pin the planner to the intended index, but keep serving reads if it is missing.
+    try:
+        return list(cursor.clone().hint(hint))
+    except OperationFailure as exc:
+        logger.warning("Index hint %s failed, retrying without it: %s", hint, exc)
+        return list(cursor)
+
+
+def _normalize_ws(text: str) -> str:
+    # Most chat messages are already single-spaced; only rewrite when a collapse is needed.
+    if _WS_NEEDS_COLLAPSE_RE.search(text) is None:
+        return text.strip()
+    return _WS_RE.sub(" ", text).strip()
+
+
+def _pending_reflection_filter(user_id: int) -> dict[str, Any]:
+    return {
+        "user_id": user_id,
+        "skipped": False,
+        "answer": None,
+    }
 
 
 def _safe_object_id(raw: str) -> Optional[ObjectId]:
@@ -475,23 +833,43 @@ def _safe_object_id(raw: str) -> Optional[ObjectId]:
         return None
 
 
+@functools.lru_cache(maxsize=32)
 def _at_start_of_day_utc(day: date) -> datetime:
     return datetime.combine(day, time.min, tzinfo=timezone.utc)
 
 
-def _at_end_of_day_utc(day: date) -> datetime:
-    return datetime.combine(day, time.max, tzinfo=timezone.utc)
-
-
+@functools.lru_cache(maxsize=2048)
 def _next_weekday_on_or_after(day: date, weekday: int) -> date:
     delta = (weekday - day.weekday()) % 7
     return day + timedelta(days=delta)
 
 
-def _default_deadline_one_month(reference: datetime) -> datetime:
-    year = reference.year
-    month = reference.month
-    day = reference.day
+def _next_weekday_on_or_after_expr(day_expr: Any) -> dict[str, Any]:
+    # Aggregation-expression twin of _next_weekday_on_or_after for pipeline updates,
+    # snapping to the document's preferred_weekday (Monday=0, like date.weekday()).
+    weekday_gap = {
+        "$subtract": [
+            {"$ifNull": ["$preferred_weekday", 5]},
+            {"$subtract": [{"$isoDayOfWeek": "$$day"}, 1]},
+        ]
+    }
+    return {
+        "$let": {
+            "vars": {"day": day_expr},
+            "in": {"$add": ["$$day", {"$multiply": [{"$mod": [{"$add": [weekday_gap, 7]}, 7]}, _DAY_MS]}]},
+        }
+    }
+
+
+def default_deadline_one_month(reference: datetime) -> datetime:
+    return _end_of_day_one_month_after(reference.date())
+
+
+@functools.lru_cache(maxsize=32)
+def _end_of_day_one_month_after(reference_day: date) -> datetime:
+    year = reference_day.year
+    month = reference_day.month
+    day = reference_day.day
 
     next_month = 1 if month == 12 else month + 1
     next_year = year + 1 if month == 12 else year
@@ -1,20 +1,38 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from typing import Optional
-
-from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Update
+import asyncio
+import functools
+import logging
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from time import monotonic
+from typing import Any, Awaitable, Callable, Optional
+
+from telegram import CallbackQuery, InlineKeyboardButton, InlineKeyboardMarkup, Message, Update
 from telegram.ext import (
+    Application,
+    ApplicationHandlerStop,
     CallbackQueryHandler,
     CommandHandler,
     ContextTypes,
     ConversationHandler,
     MessageHandler,
+    TypeHandler,
     filters,
 )
 
-from bot.jobs import DAILY_REFLECTION_QUESTIONS, generate_coaching_message, generate_improvement_message
+from bot.async_store import AsyncStore
+from bot.db import TODO_CARD_PROJECTION
+from bot.jobs import (
+    DAILY_REFLECTION_QUESTIONS,
+    forget_job_user_ids,
+    get_coaching_message,
+    get_improvement_message,
+)
 from bot.utils import (
+    CallbackAction,
     ParsedAddPayload,
     format_deadline,
     infer_project_type,
@@ -22,9 +40,31 @@ from bot.utils import (
     parse_deadline,
     parse_priority,
     priority_to_label,
+    to_utc,
 )
 
+
+logger = logging.getLogger(__name__)
+
 ADD_TITLE, ADD_PRIORITY, ADD_DEADLINE = range(3)
+LIST_MESSAGE_MAX_CHARS = 4096
+# Room kept per task on a /list page for the "Status: ..." line a Done/Delete press appends.
+LIST_STATUS_RESERVE_CHARS = 40
+# Two buttons per task and Telegram caps an inline keyboard at 100 buttons.
+LIST_MESSAGE_MAX_TODOS = 50
+USER_CACHE_MAX_SIZE = 10_000
+USER_CACHE_TTL_SECONDS = 600.0
+ACTION_DEDUP_WINDOW_SECONDS = 10.0
+TODOS_CACHE_TTL_SECONDS = 15.0
+TODOS_CACHE_MAX_SIZE = 5_000
+# user_id -> ((username, first_name) last written to the store, monotonic expiry).
+_USER_CACHE: OrderedDict[int, tuple[tuple[str, str], float]] = OrderedDict()
+# (user_id, action, target_id) -> monotonic time the button press was handled.
+_RECENT_ACTIONS: dict[tuple[int, int, str], float] = {}
+# user_id -> (monotonic expiry, /list page); evicted whenever this process changes the user's todos.
+_TODOS_CACHE: dict[int, tuple[float, list[dict]]] = {}
+# Filled by bind_dependencies() from the application's bot_data.
+_DEPS: dict[str, Any] = {}
 HELP_TEXT = (
     "Commands:\n"
     "/start - initialize profile and show overview\n"
@@ -45,21 +85,39 @@ HELP_TEXT = (
     "Deadline: YYYY-MM-DD, or skip/none (defaults to +1 month).\n"
     "Tip: send non-command text as accomplishment/blocker notes for smarter coaching."
 )
+_START_TEXT = "To-Do Coach is active.\n\n" + HELP_TEXT
+_SKIP_TOKENS = frozenset({"pass", "skip", "/pass"})
+
+
+@dataclass
+class AddDraft:
+    # State of the interactive /add conversation, kept in user_data["add_task"].
+    title: str = ""
+    priority: int = 2
 
 
 def _format_utc_date(value: Optional[datetime]) -> str:
     if not value:
         return "n/a"
-    return value.astimezone(timezone.utc).strftime("%Y-%m-%d")
+    return _fmt_utc_date(value)
+
 
+# Datetimes are immutable and hash by instant; repeated /list and /chores renders hit the cache.
+@functools.lru_cache(maxsize=8192)
+def _fmt_utc_date(value: datetime) -> str:
+    utc_value = to_utc(value)
+    # Same output as strftime("%Y-%m-%d") without going through the C strftime machinery.
+    return f"{utc_value.year:04d}-{utc_value.month:02d}-{utc_value.day:02d}"
 
-def _get_allowed_chat_id(context: ContextTypes.DEFAULT_TYPE) -> Optional[int]:
-    settings = context.application.bot_data["settings"]
-    return settings.allowed_chat_id
+
+def bind_dependencies(application: Application) -> None:
+    # Resolve shared objects once at startup instead of per update through bot_data.
+    _DEPS["store"] = application.bot_data["async_store"]
+    _DEPS["allowed_chat_id"] = application.bot_data["settings"].allowed_chat_id
 
 
 def _is_authorized_chat(update: Update, context: ContextTypes.DEFAULT_TYPE) -> bool:
-    allowed_chat_id = _get_allowed_chat_id(context)
+    allowed_chat_id = _DEPS["allowed_chat_id"]
     if allowed_chat_id is None:
         return True
     if not update.effective_chat:
@@ -75,58 +133,160 @@ async def _deny_unauthorized(update: Update) -> None:
         await update.effective_message.reply_text("Unauthorized chat.")
 
 
-async def _authorize_chat(update: Update, context: ContextTypes.DEFAULT_TYPE) -> bool:
+async def _auth_gate(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    # Runs in group -1 ahead of every handler, so individual handlers skip the chat check.
     if _is_authorized_chat(update, context):
-        return True
-    await _deny_unauthorized(update)
-    return False
+        return
+    # Only answer what the handlers serve (commands, text, buttons); stay silent on photos,
+    # stickers, service and edited messages so a foreign group chat is not spammed.
+    if update.callback_query or (update.message and update.message.text):
+        await _deny_unauthorized(update)
+    raise ApplicationHandlerStop
 
 
-def _todo_message(todo: dict, index: int) -> str:
-    todo_id = str(todo.get("_id"))
-    added_date = _format_utc_date(todo.get("created_at"))
-    project_type = str(todo.get("project_type") or infer_project_type(str(todo.get("title", ""))))
-    return (
-        f"[{index}] {todo.get('title')}\n"
-        f"Type: {project_type}\n"
-        f"Priority: {priority_to_label(int(todo.get('priority', 2)))}\n"
-        f"Deadline: {format_deadline(todo.get('deadline'))}\n"
-        f"Added: {added_date}\n"
-        f"Task ID: {todo_id}"
+def build_auth_gate() -> TypeHandler:
+    return TypeHandler(Update, _auth_gate)
+
+
+def _todo_message(todo: dict, index: int, todo_id: str) -> str:
+    title = todo.get("title")
+    return "\n".join(
+        (
+            f"[{index}] {title}",
+            "Type: " + (todo.get("project_type") or infer_project_type(str(title or ""))),
+            "Priority: " + priority_to_label(int(todo.get("priority", 2))),
+            "Deadline: " + format_deadline(todo.get("deadline")),
+            "Added: " + _format_utc_date(todo.get("created_at")),
+            "Task ID: " + todo_id,
+        )
     )
 
 
-def _save_parsed_todo(context: ContextTypes.DEFAULT_TYPE, user_id: int, parsed: ParsedAddPayload) -> dict:
-    store = context.application.bot_data["store"]
-    return store.add_todo(
-        user_id=user_id,
-        title=parsed.title,
-        priority=parsed.priority,
-        deadline=parsed.deadline,
+async def _save_parsed_todo(context: ContextTypes.DEFAULT_TYPE, user_id: int, parsed: ParsedAddPayload) -> dict:
+    store = _DEPS["store"]
+    try:
+        return await store.add_todo(
+            user_id=user_id,
+            title=parsed.title,
+            priority=parsed.priority,
+            deadline=parsed.deadline,
+        )
+    finally:
+        _invalidate_todos(user_id)
+
+
+def _cached_todos(user_id: int) -> Optional[list[dict]]:
+    entry = _TODOS_CACHE.get(user_id)
+    if entry is None:
+        return None
+    expires_at, todos = entry
+    if expires_at < monotonic():
+        _TODOS_CACHE.pop(user_id, None)
+        return None
+    return todos
+
+
+def _cache_todos(user_id: int, todos: list[dict]) -> None:
+    if user_id not in _TODOS_CACHE and len(_TODOS_CACHE) >= TODOS_CACHE_MAX_SIZE:
+        _TODOS_CACHE.pop(next(iter(_TODOS_CACHE)))
+    _TODOS_CACHE[user_id] = (monotonic() + TODOS_CACHE_TTL_SECONDS, todos)
+
+
+def _invalidate_todos(user_id: int) -> None:
+    _TODOS_CACHE.pop(user_id, None)
+
+
+async def _save_and_confirm(
+    update: Update, context: ContextTypes.DEFAULT_TYPE, user_id: int, parsed: ParsedAddPayload
+) -> None:
+    # Confirm only once the insert is known to have worked.
+    try:
+        saved = await _save_parsed_todo(context, user_id=user_id, parsed=parsed)
+    except Exception as exc:
+        logger.warning("Saving todo for user %s failed: %s", user_id, exc)
+        await update.effective_message.reply_text("Could not save that task. Please try again.")
+        return
+    await update.effective_message.reply_text(
+        f"Added: {saved['title']} | priority {priority_to_label(saved['priority'])} "
+        f"| deadline {format_deadline(saved['deadline'])}"
     )
 
 
-def _ensure_user(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Optional[int]:
+async def _ensure_user(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Optional[int]:
     if not update.effective_user:
         return None
-    store = context.application.bot_data["store"]
     user = update.effective_user
-    store.upsert_user(user_id=user.id, username=user.username or "", first_name=user.first_name or "")
+    key = (user.username or "", user.first_name or "")
+    now = monotonic()
+    cached = _USER_CACHE.get(user.id)
+    if cached is not None and cached[0] == key and cached[1] > now:
+        _USER_CACHE.move_to_end(user.id)
+        return user.id
+    store = _DEPS["store"]
+    await store.upsert_user(user_id=user.id, username=key[0], first_name=key[1])
+    forget_job_user_ids(context.application.bot_data, user.id)
+    # Re-upsert after the TTL so updated_at and documents removed elsewhere are refreshed.
+    _USER_CACHE[user.id] = (key, now + USER_CACHE_TTL_SECONDS)
+    _USER_CACHE.move_to_end(user.id)
+    if len(_USER_CACHE) > USER_CACHE_MAX_SIZE:
+        _USER_CACHE.popitem(last=False)
     return user.id
 
 
-def _build_chore_action_keyboard(chore_id: str) -> InlineKeyboardMarkup:
-    return InlineKeyboardMarkup(
-        [
-            [
-                InlineKeyboardButton("Done", callback_data=f"chore_done:{chore_id}"),
-                InlineKeyboardButton("Not done", callback_data=f"chore_not_done:{chore_id}"),
-            ],
-            [InlineKeyboardButton("Pass weekend", callback_data=f"chore_pass_weekend:{chore_id}")],
-        ]
+# PTB 20 Telegram objects are immutable, so cached buttons and markups are safe to share.
+@functools.lru_cache(maxsize=1024)
+def _todo_action_row(index: int, todo_id: str) -> tuple[InlineKeyboardButton, InlineKeyboardButton]:
+    return (
+        InlineKeyboardButton(f"[{index}] Done", callback_data=CallbackAction.TODO_DONE.data(todo_id)),
+        InlineKeyboardButton(f"[{index}] Delete", callback_data=CallbackAction.TODO_DELETE.data(todo_id)),
+    )
+
+
+def _build_todo_list_keyboard(entries: list[tuple[int, str]]) -> InlineKeyboardMarkup:
+    return InlineKeyboardMarkup([_todo_action_row(index, todo_id) for index, todo_id in entries])
+
+
+def _mark_card(
+    message: Message, marker: str, target_id: str, status: str
+) -> tuple[str, Optional[InlineKeyboardMarkup]]:
+    # /list and /chores messages hold several cards; tag the one that was acted on and drop its buttons.
+    status_line = f"Status: {status}."
+    cards = message.text.split("\n\n")
+    text = "\n\n".join(f"{card}\n{status_line}" if card.endswith(marker) else card for card in cards)
+    if text == message.text:
+        text = f"{message.text}\n\n{status_line}"
+    if len(text) > LIST_MESSAGE_MAX_CHARS:
+        # Over Telegram's limit the edit would fail after the write succeeded; shrink the card to its title.
+        text = "\n\n".join(
+            f"{card.split(chr(10), 1)[0]}\n{status_line}" if card.endswith(marker) else card for card in cards
+        )[:LIST_MESSAGE_MAX_CHARS]
+    suffix = f":{target_id}"
+    keyboard = message.reply_markup.inline_keyboard if message.reply_markup else ()
+    rows = [
+        row for row in keyboard if not any(str(button.callback_data or "").endswith(suffix) for button in row)
+    ]
+    return text, InlineKeyboardMarkup(rows) if rows else None
+
+
+@functools.lru_cache(maxsize=1024)
+def _chore_action_rows(index: int, chore_id: str) -> tuple[tuple[InlineKeyboardButton, ...], ...]:
+    return (
+        (
+            InlineKeyboardButton(f"[{index}] Done", callback_data=CallbackAction.CHORE_DONE.data(chore_id)),
+            InlineKeyboardButton(f"[{index}] Not done", callback_data=CallbackAction.CHORE_NOT_DONE.data(chore_id)),
+        ),
+        (
+            InlineKeyboardButton(
+                f"[{index}] Pass weekend", callback_data=CallbackAction.CHORE_PASS_WEEKEND.data(chore_id)
+            ),
+        ),
     )
 
 
+def _build_chore_list_keyboard(entries: list[tuple[int, str]]) -> InlineKeyboardMarkup:
+    return InlineKeyboardMarkup([row for index, chore_id in entries for row in _chore_action_rows(index, chore_id)])
+
+
 def _build_reflection_prompt_text(question: str) -> str:
     return (
         "Daily Reflection (5 min)\n\n"
@@ -136,33 +296,33 @@ def _build_reflection_prompt_text(question: str) -> str:
     )
 
 
-async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not update.effective_user or not update.effective_message:
+async def _send_next_reflection(update: Update, next_pending: Optional[dict], remaining: int) -> None:
+    if not next_pending or remaining <= 0:
         return
-    if not await _authorize_chat(update, context):
-        return
-    _ensure_user(update, context)
     await update.effective_message.reply_text(
-        "To-Do Coach is active.\n\n"
-        + HELP_TEXT
+        _build_reflection_prompt_text(str(next_pending.get("question", "Who am I?")))
+        + f"\n\nPending reflections: {remaining}"
     )
 
 
+async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    if not update.effective_user or not update.effective_message:
+        return
+    await _ensure_user(update, context)
+    await update.effective_message.reply_text(_START_TEXT)
+
+
 async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     if not update.effective_message:
         return
-    if not await _authorize_chat(update, context):
-        return
     await update.effective_message.reply_text(HELP_TEXT)
 
 
 async def goal_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     if not update.effective_user or not update.effective_message:
         return
-    if not await _authorize_chat(update, context):
-        return
-    store = context.application.bot_data["store"]
-    user_id = _ensure_user(update, context)
+    store = _DEPS["store"]
+    user_id = await _ensure_user(update, context)
     if user_id is None:
         return
 
@@ -171,11 +331,11 @@ async def goal_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
         if not new_goal:
             await update.effective_message.reply_text("Goal cannot be empty.")
             return
-        store.set_main_goal(user_id, new_goal)
+        await store.set_main_goal(user_id, new_goal)
         await update.effective_message.reply_text(f"Main goal updated: {new_goal}")
         return
 
-    profile = store.get_user_profile(user_id)
+    profile = await store.get_user_profile(user_id, fields=("main_goal",))
     goal = profile.get("main_goal", "make money")
     await update.effective_message.reply_text(f"Current main goal: {goal}")
 
@@ -183,9 +343,7 @@ async def goal_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
 async def add_entry_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     if not update.effective_user or not update.effective_message:
         return ConversationHandler.END
-    if not await _authorize_chat(update, context):
-        return ConversationHandler.END
-    user_id = _ensure_user(update, context)
+    user_id = await _ensure_user(update, context)
     if user_id is None:
         return ConversationHandler.END
 
@@ -196,13 +354,10 @@ async def add_entry_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
             await update.effective_message.reply_text(f"{error}\nExample: /add Call lead | high | 2026-03-01")
             return ConversationHandler.END
 
-        saved = _save_parsed_todo(context, user_id=user_id, parsed=parsed)
-        await update.effective_message.reply_text(
-            f"Added: {saved.get('title')} | priority {priority_to_label(saved.get('priority', 2))} | deadline {format_deadline(saved.get('deadline'))}"
-        )
+        await _save_and_confirm(update, context, user_id=user_id, parsed=parsed)
         return ConversationHandler.END
 
-    context.user_data["add_task"] = {}
+    context.user_data["add_task"] = AddDraft()
     await update.effective_message.reply_text("Send task title.")
     return ADD_TITLE
 
@@ -210,14 +365,12 @@ async def add_entry_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
 async def add_title(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     if not update.effective_message:
         return ConversationHandler.END
-    if not await _authorize_chat(update, context):
-        return ConversationHandler.END
     title = update.effective_message.text.strip()
     if not title:
         await update.effective_message.reply_text("Title cannot be empty. Send task title.")
         return ADD_TITLE
 
-    context.user_data["add_task"] = {"title": title}
+    context.user_data["add_task"] = AddDraft(title=title)
     await update.effective_message.reply_text("Send priority: high/medium/low (or 1/2/3).")
     return ADD_PRIORITY
 
@@ -225,15 +378,16 @@ async def add_title(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
 async def add_priority(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     if not update.effective_message:
         return ConversationHandler.END
-    if not await _authorize_chat(update, context):
-        return ConversationHandler.END
     priority_raw = update.effective_message.text.strip()
     priority = parse_priority(priority_raw)
     if priority is None:
         await update.effective_message.reply_text("Invalid priority. Use high/medium/low or 1/2/3.")
         return ADD_PRIORITY
 
-    context.user_data.setdefault("add_task", {})["priority"] = priority
+    draft = context.user_data.get("add_task")
+    if draft is None:
+        draft = context.user_data["add_task"] = AddDraft()
+    draft.priority = priority
     await update.effective_message.reply_text(
         "Send deadline in YYYY-MM-DD, or `skip` for default (+1 month).",
         parse_mode="Markdown",
@@ -244,33 +398,26 @@ async def add_priority(update: Update, context: ContextTypes.DEFAULT_TYPE) -> in
 async def add_deadline(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     if not update.effective_user or not update.effective_message:
         return ConversationHandler.END
-    if not await _authorize_chat(update, context):
-        return ConversationHandler.END
     deadline_raw = update.effective_message.text.strip()
     deadline, error = parse_deadline(deadline_raw)
     if error:
         await update.effective_message.reply_text(error)
         return ADD_DEADLINE
 
-    draft = context.user_data.get("add_task", {})
-    title = draft.get("title", "").strip()
-    priority = int(draft.get("priority", 2))
+    draft = context.user_data.get("add_task") or AddDraft()
+    title = draft.title.strip()
+    priority = draft.priority
     if not title:
         await update.effective_message.reply_text("Task title missing. Start again with /add.")
         return ConversationHandler.END
 
     parsed = ParsedAddPayload(title=title, priority=priority, deadline=deadline)
-    saved = _save_parsed_todo(context, user_id=update.effective_user.id, parsed=parsed)
     context.user_data.pop("add_task", None)
-    await update.effective_message.reply_text(
-        f"Added: {saved.get('title')} | priority {priority_to_label(priority)} | deadline {format_deadline(deadline)}"
-    )
+    await _save_and_confirm(update, context, user_id=update.effective_user.id, parsed=parsed)
     return ConversationHandler.END
 
 
 async def add_cancel(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-    if not await _authorize_chat(update, context):
-        return ConversationHandler.END
     if update.effective_message:
         await update.effective_message.reply_text("Add flow canceled.")
     context.user_data.pop("add_task", None)
@@ -280,62 +427,72 @@ async def add_cancel(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
 async def list_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     if not update.effective_user or not update.effective_message:
         return
-    if not await _authorize_chat(update, context):
-        return
-    store = context.application.bot_data["store"]
-    user_id = _ensure_user(update, context)
-    if user_id is None:
-        return
-    todos = store.list_active_todos(user_id=user_id, limit=30)
+    store = _DEPS["store"]
+    user_id = update.effective_user.id
+    todos = _cached_todos(user_id)
+    if todos is None:
+        # The task read does not depend on the profile upsert, so a first-time user pays one RTT, not two.
+        _, todos = await asyncio.gather(
+            _ensure_user(update, context),
+            store.list_active_todos(user_id=user_id, limit=30, projection=TODO_CARD_PROJECTION),
+        )
+        _cache_todos(user_id, todos)
+    else:
+        await _ensure_user(update, context)
     if not todos:
         await update.effective_message.reply_text("No active tasks.")
         return
 
-    await update.effective_message.reply_text(
-        "Active tasks. Use each task's buttons to mark done or delete."
-    )
+    # One message per page instead of one per task; a page only splits at Telegram's limits.
+    header = "Active tasks. Use the buttons below to mark a task done or delete it."
+    pages: list[tuple[list[str], list[tuple[int, str]]]] = []
+    cards, entries, size = [header], [], len(header)
     for index, todo in enumerate(todos, start=1):
         todo_id = str(todo.get("_id"))
-        keyboard = InlineKeyboardMarkup(
-            [
-                [
-                    InlineKeyboardButton("Done", callback_data=f"done:{todo_id}"),
-                    InlineKeyboardButton("Delete", callback_data=f"delete:{todo_id}"),
-                ]
-            ]
-        )
+        card = _todo_message(todo, index=index, todo_id=todo_id)
+        reserved = LIST_STATUS_RESERVE_CHARS * (len(entries) + 1)
+        if entries and (
+            size + 2 + len(card) + reserved > LIST_MESSAGE_MAX_CHARS or len(entries) >= LIST_MESSAGE_MAX_TODOS
+        ):
+            pages.append((cards, entries))
+            cards, entries, size = [], [], -2
+        cards.append(card)
+        entries.append((index, todo_id))
+        size += 2 + len(card)
+    pages.append((cards, entries))
+
+    for cards, entries in pages:
         await update.effective_message.reply_text(
-            _todo_message(todo, index=index),
-            reply_markup=keyboard,
+            "\n\n".join(cards),
+            reply_markup=_build_todo_list_keyboard(entries),
         )
 
 
 async def chores_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     if not update.effective_message:
         return
-    if not await _authorize_chat(update, context):
-        return
-    store = context.application.bot_data["store"]
-    user_id = _ensure_user(update, context)
+    store = _DEPS["store"]
+    user_id = await _ensure_user(update, context)
     if user_id is None:
         return
 
-    due_chores = store.list_due_chores(user_id=user_id)
+    due_chores = await store.list_due_chores(user_id=user_id)
     if due_chores:
-        await update.effective_message.reply_text(
-            "Weekend chore reminder\n\nConfirm each chore one by one:"
-        )
-        for chore in due_chores:
+        # One message with a button group per chore, like /list, instead of one message each.
+        cards = ["Weekend chore reminder. Confirm each chore with the buttons below:"]
+        entries = []
+        for index, chore in enumerate(due_chores, start=1):
             chore_id = str(chore.get("_id"))
-            name = chore.get("name", "")
             next_due = _format_utc_date(chore.get("next_due_date"))
-            await update.effective_message.reply_text(
-                f"{name}\nDue since: {next_due}\n\nDone today?",
-                reply_markup=_build_chore_action_keyboard(chore_id),
-            )
+            cards.append(f"[{index}] {chore.get('name', '')}\nDue since: {next_due}\nChore ID: {chore_id}")
+            entries.append((index, chore_id))
+        await update.effective_message.reply_text(
+            "\n\n".join(cards),
+            reply_markup=_build_chore_list_keyboard(entries),
+        )
         return
 
-    all_chores = store.list_chores(user_id=user_id)
+    all_chores = await store.list_chores(user_id=user_id)
     if not all_chores:
         await update.effective_message.reply_text("No recurring chores configured.")
         return
@@ -349,123 +506,167 @@ async def chores_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     await update.effective_message.reply_text("\n".join(lines))
 
 
+def _is_repeated_action(key: tuple[int, int, str]) -> bool:
+    # Double-taps deliver the same callback twice; only the first press reaches MongoDB.
+    now = monotonic()
+    cutoff = now - ACTION_DEDUP_WINDOW_SECONDS
+    # Keys are only inserted when absent, so the dict stays in press order and expired keys lead.
+    while _RECENT_ACTIONS:
+        oldest = next(iter(_RECENT_ACTIONS))
+        if _RECENT_ACTIONS[oldest] >= cutoff:
+            break
+        del _RECENT_ACTIONS[oldest]
+    if key in _RECENT_ACTIONS:
+        return True
+    _RECENT_ACTIONS[key] = now
+    return False
+
+
+_NOT_FOUND_STATUS = "not found/already updated"
+
+
+async def _edit_chore_card(query: CallbackQuery, chore_id: str, status: str) -> None:
+    # Reminder-job messages carry a single chore and no ID line; _mark_card appends the status to those.
+    text, keyboard = _mark_card(query.message, f"Chore ID: {chore_id}", chore_id, status)
+    await query.edit_message_text(text, reply_markup=keyboard)
+
+
+async def _on_todo_done(query: CallbackQuery, store: AsyncStore, user_id: int, target_id: str) -> None:
+    ok = await store.mark_todo_done(user_id=user_id, todo_id=target_id)
+    _invalidate_todos(user_id)
+    status = "completed" if ok else _NOT_FOUND_STATUS
+    text, keyboard = _mark_card(query.message, f"Task ID: {target_id}", target_id, status)
+    await query.edit_message_text(text, reply_markup=keyboard)
+
+
+async def _on_todo_delete(query: CallbackQuery, store: AsyncStore, user_id: int, target_id: str) -> None:
+    ok = await store.delete_todo(user_id=user_id, todo_id=target_id)
+    _invalidate_todos(user_id)
+    status = "deleted" if ok else _NOT_FOUND_STATUS
+    text, keyboard = _mark_card(query.message, f"Task ID: {target_id}", target_id, status)
+    await query.edit_message_text(text, reply_markup=keyboard)
+
+
+async def _on_chore_done(query: CallbackQuery, store: AsyncStore, user_id: int, target_id: str) -> None:
+    updated = await store.mark_chore_done(user_id=user_id, chore_id=target_id)
+    if updated:
+        status = f"confirmed done. Next due: {_format_utc_date(updated.get('next_due_date'))}"
+    else:
+        status = _NOT_FOUND_STATUS
+    await _edit_chore_card(query, target_id, status)
+
+
+async def _on_chore_not_done(query: CallbackQuery, store: AsyncStore, user_id: int, target_id: str) -> None:
+    await _edit_chore_card(query, target_id, "not done. I will keep reminding you on weekend days")
+
+
+async def _on_chore_pass_weekend(query: CallbackQuery, store: AsyncStore, user_id: int, target_id: str) -> None:
+    updated = await store.postpone_chore_to_next_weekend(user_id=user_id, chore_id=target_id)
+    if updated:
+        next_due = _format_utc_date(updated.get("next_due_date"))
+        status = f"passed for this weekend. It will come back next weekend ({next_due})"
+    else:
+        status = _NOT_FOUND_STATUS
+    await _edit_chore_card(query, target_id, status)
+
+
+_ACTIONS: dict[CallbackAction, Callable[[CallbackQuery, AsyncStore, int, str], Awaitable[None]]] = {
+    CallbackAction.TODO_DONE: _on_todo_done,
+    CallbackAction.TODO_DELETE: _on_todo_delete,
+    CallbackAction.CHORE_DONE: _on_chore_done,
+    CallbackAction.CHORE_NOT_DONE: _on_chore_not_done,
+    CallbackAction.CHORE_PASS_WEEKEND: _on_chore_pass_weekend,
+}
+# callback_data prefix -> action. Buttons sent before the numeric codes still carry the action names.
+_ACTION_CODES: dict[str, CallbackAction] = {
+    **{str(action.value): action for action in _ACTIONS},
+    "done": CallbackAction.TODO_DONE,
+    "delete": CallbackAction.TODO_DELETE,
+    "chore_done": CallbackAction.CHORE_DONE,
+    "chore_not_done": CallbackAction.CHORE_NOT_DONE,
+    "chore_pass_weekend": CallbackAction.CHORE_PASS_WEEKEND,
+}
+# Built from _ACTION_CODES so the handler filter and the dispatch table cannot drift apart.
+_CALLBACK_PATTERN = re.compile(
+    "^(?P<action>" + "|".join(map(re.escape, _ACTION_CODES)) + "):(?P<target>.+)$", re.DOTALL
+)
+
+
 async def todo_action_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     if not update.callback_query or not update.effective_user:
         return
-    if not await _authorize_chat(update, context):
-        return
     query = update.callback_query
     await query.answer()
     if not query.message or not query.message.text:
         return
 
-    raw = query.data or ""
-    if ":" not in raw:
+    # CallbackQueryHandler already ran _CALLBACK_PATTERN; reuse its match instead of re-parsing.
+    match = context.matches[0] if context.matches else _CALLBACK_PATTERN.match(query.data or "")
+    if match is None:
         return
-    action, todo_id = raw.split(":", maxsplit=1)
-    store = context.application.bot_data["store"]
+    action, target_id = _ACTION_CODES[match["action"]], match["target"]
+    handler = _ACTIONS[action]
     user_id = update.effective_user.id
-
-    if action == "done":
-        ok = store.mark_todo_done(user_id=user_id, todo_id=todo_id)
-        if ok:
-            await query.edit_message_text(f"{query.message.text}\n\nStatus: completed.")
-        else:
-            await query.edit_message_text(f"{query.message.text}\n\nStatus: not found/already updated.")
+    key = (user_id, action, target_id)
+    if _is_repeated_action(key):
         return
-
-    if action == "delete":
-        ok = store.delete_todo(user_id=user_id, todo_id=todo_id)
-        if ok:
-            await query.edit_message_text(f"{query.message.text}\n\nStatus: deleted.")
-        else:
-            await query.edit_message_text(f"{query.message.text}\n\nStatus: not found/already updated.")
-        return
-
-    if action == "chore_done":
-        updated = store.mark_chore_done(user_id=user_id, chore_id=todo_id)
-        if updated:
-            next_due = _format_utc_date(updated.get("next_due_date"))
-            await query.edit_message_text(f"{query.message.text}\n\nStatus: confirmed done. Next due: {next_due}.")
-        else:
-            await query.edit_message_text(f"{query.message.text}\n\nStatus: not found/already updated.")
-        return
-
-    if action == "chore_not_done":
-        await query.edit_message_text(
-            f"{query.message.text}\n\nStatus: not done. I will keep reminding you on weekend days."
-        )
-        return
-
-    if action == "chore_pass_weekend":
-        updated = store.postpone_chore_to_next_weekend(user_id=user_id, chore_id=todo_id)
-        if updated:
-            next_due = _format_utc_date(updated.get("next_due_date"))
-            await query.edit_message_text(
-                f"{query.message.text}\n\nStatus: passed for this weekend. It will come back next weekend ({next_due})."
-            )
-        else:
-            await query.edit_message_text(f"{query.message.text}\n\nStatus: not found/already updated.")
+    try:
+        await handler(query, _DEPS["store"], user_id, target_id)
+    except Exception:
+        # A failed press must not swallow the user's retry.
+        _RECENT_ACTIONS.pop(key, None)
+        raise
 
 
 async def checkin_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     if not update.effective_user or not update.effective_message:
         return
-    if not await _authorize_chat(update, context):
-        return
-    _ensure_user(update, context)
-    message = generate_coaching_message(context, user_id=update.effective_user.id, weekly=False)
+    await _ensure_user(update, context)
+    message = await get_coaching_message(context, user_id=update.effective_user.id, weekly=False)
     await update.effective_message.reply_text(message)
 
 
 async def review_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     if not update.effective_user or not update.effective_message:
         return
-    if not await _authorize_chat(update, context):
-        return
-    _ensure_user(update, context)
-    message = generate_coaching_message(context, user_id=update.effective_user.id, weekly=True)
+    await _ensure_user(update, context)
+    message = await get_coaching_message(context, user_id=update.effective_user.id, weekly=True)
     await update.effective_message.reply_text(message)
 
 
 async def improve_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     if not update.effective_user or not update.effective_message:
         return
-    if not await _authorize_chat(update, context):
-        return
-    _ensure_user(update, context)
-    message = generate_improvement_message(context, user_id=update.effective_user.id)
+    await _ensure_user(update, context)
+    message = await get_improvement_message(context, user_id=update.effective_user.id)
     await update.effective_message.reply_text(message)
 
 
 async def reflect_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     if not update.effective_user or not update.effective_message:
         return
-    if not await _authorize_chat(update, context):
-        return
-    store = context.application.bot_data["store"]
-    user_id = _ensure_user(update, context)
+    store = _DEPS["store"]
+    user_id = await _ensure_user(update, context)
     if user_id is None:
         return
 
-    created_questions: list[str] = []
-    for question in DAILY_REFLECTION_QUESTIONS:
-        created = store.ensure_daily_reflection_prompt(
+    created_keys = set(
+        await store.ensure_daily_reflection_prompts_bulk(
             user_id=user_id,
-            question_key=question["key"],
-            question=question["text"],
+            questions=DAILY_REFLECTION_QUESTIONS,
         )
-        if created:
-            created_questions.append(question["text"])
+    )
+    created_questions = [
+        question["text"] for question in DAILY_REFLECTION_QUESTIONS if question["key"] in created_keys
+    ]
 
     if created_questions:
         for question_text in created_questions:
             await update.effective_message.reply_text(_build_reflection_prompt_text(question_text))
         return
 
-    pending = store.get_pending_reflection(user_id)
+    pending, remaining = await store.peek_pending_reflections(user_id=user_id)
     if pending:
-        remaining = store.count_pending_reflections(user_id=user_id)
         suffix = f"\n\nPending reflections: {remaining}" if remaining > 1 else ""
         await update.effective_message.reply_text(
             _build_reflection_prompt_text(str(pending.get("question", "Who am I?"))) + suffix
@@ -478,29 +679,21 @@ async def reflect_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
 async def pass_reflection_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     if not update.effective_user or not update.effective_message:
         return
-    if not await _authorize_chat(update, context):
-        return
-    store = context.application.bot_data["store"]
-    user_id = _ensure_user(update, context)
+    store = _DEPS["store"]
+    user_id = await _ensure_user(update, context)
     if user_id is None:
         return
 
-    pending = store.get_pending_reflection(user_id=user_id)
+    pending, remaining = await store.get_pending_reflection_with_count(user_id=user_id)
     if not pending:
         await update.effective_message.reply_text("No pending reflection to skip right now.")
         return
 
-    if store.pass_pending_reflection(user_id=user_id, skip_note="pass_command"):
-        question = str(pending.get("question", "Reflection question"))
-        remaining = store.count_pending_reflections(user_id=user_id)
+    if await store.pass_pending_reflection(user_id=user_id, skip_note="pass_command"):
+        question = str(pending[0].get("question", "Reflection question"))
         await update.effective_message.reply_text(f"Skipped: {question}")
-        if remaining > 0:
-            next_pending = store.get_pending_reflection(user_id=user_id)
-            if next_pending:
-                await update.effective_message.reply_text(
-                    _build_reflection_prompt_text(str(next_pending.get("question", "Who am I?")))
-                    + f"\n\nPending reflections: {remaining}"
-                )
+        # pending[0] was just skipped; pending[1], if any, is the one to ask next.
+        await _send_next_reflection(update, pending[1] if len(pending) > 1 else None, remaining - 1)
         return
     await update.effective_message.reply_text("Could not skip reflection right now.")
 
@@ -508,51 +701,34 @@ async def pass_reflection_command(update: Update, context: ContextTypes.DEFAULT_
 async def capture_notes(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     if not update.effective_user or not update.effective_message or not update.effective_message.text:
         return
-    if not await _authorize_chat(update, context):
-        return
     text = update.effective_message.text.strip()
     if not text:
         return
-    store = context.application.bot_data["store"]
+    store = _DEPS["store"]
     user_id = update.effective_user.id
-    pending_before = store.get_pending_reflection(user_id=user_id)
 
     lowered = text.lower()
-    if lowered in {"pass", "skip", "/pass"}:
-        if store.pass_pending_reflection(user_id=user_id, skip_note=lowered):
-            remaining = store.count_pending_reflections(user_id=user_id)
+    if lowered in _SKIP_TOKENS:
+        if await store.pass_pending_reflection(user_id=user_id, skip_note=lowered):
             await update.effective_message.reply_text("Reflection skipped for today.")
-            if remaining > 0:
-                next_pending = store.get_pending_reflection(user_id=user_id)
-                if next_pending:
-                    await update.effective_message.reply_text(
-                        _build_reflection_prompt_text(str(next_pending.get("question", "Who am I?")))
-                        + f"\n\nPending reflections: {remaining}"
-                    )
+            await _send_next_reflection(update, *await store.peek_pending_reflections(user_id=user_id))
             return
 
-    if store.save_pending_reflection_answer(user_id=user_id, answer=text):
-        question_text = str((pending_before or {}).get("question") or "Reflection")
-        store.add_journal_entry(
-            user_id=user_id,
-            text=f"{question_text} -> {text}",
-            source="reflection",
-        )
-        remaining = store.count_pending_reflections(user_id=user_id)
+    # Claim first: a plain note with nothing pending costs a single round-trip.
+    answered = await store.save_pending_reflection_answer(user_id=user_id, answer=text)
+    if answered:
+        question_text = str(answered.get("question") or "Reflection")
+        await store.add_journal_entry(user_id=user_id, text=f"{question_text} -> {text}", source="reflection")
         await update.effective_message.reply_text("Saved your daily reflection.")
-        if remaining > 0:
-            next_pending = store.get_pending_reflection(user_id=user_id)
-            if next_pending:
-                await update.effective_message.reply_text(
-                    _build_reflection_prompt_text(str(next_pending.get("question", "Who am I?")))
-                    + f"\n\nPending reflections: {remaining}"
-                )
+        await _send_next_reflection(update, *await store.peek_pending_reflections(user_id=user_id))
         return
 
-    store.add_journal_entry(user_id=user_id, text=text, source="chat")
+    await store.add_journal_entry(user_id=user_id, text=text, source="chat")
 
 
-def build_handlers() -> list:
+# Built once; the tuple keeps callers from mutating the cached handler set.
+@functools.lru_cache(maxsize=None)
+def build_handlers() -> tuple:
     add_conversation = ConversationHandler(
         entry_points=[CommandHandler("add", add_entry_command)],
         states={
@@ -564,7 +740,7 @@ def build_handlers() -> list:
         allow_reentry=True,
     )
 
-    return [
+    return (
         CommandHandler("start", start_command),
         CommandHandler("help", help_command),
         CommandHandler("goal", goal_command),
@@ -576,9 +752,6 @@ def build_handlers() -> list:
         CommandHandler("improve", improve_command),
         CommandHandler("reflect", reflect_command),
         CommandHandler("pass", pass_reflection_command),
-        CallbackQueryHandler(
-            todo_action_callback,
-            pattern=r"^(done|delete|chore_done|chore_not_done|chore_pass_weekend):",
-        ),
+        CallbackQueryHandler(todo_action_callback, pattern=_CALLBACK_PATTERN),
         MessageHandler(filters.TEXT & ~filters.COMMAND, capture_notes),
-    ]
+    )
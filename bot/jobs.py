@@ -1,14 +1,18 @@
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
 import re
-from datetime import datetime, timedelta, timezone
-from statistics import mean
-from typing import Any
+from collections import OrderedDict
+from datetime import date, datetime, timedelta, timezone
+from time import monotonic
+from typing import Any, Awaitable, Callable, Iterable, Optional
 
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes
 
+from bot.db import CoachingBundle
 from bot.prompts import (
     COACH_SYSTEM_PROMPT,
     build_checkin_prompt,
@@ -16,10 +20,17 @@ from bot.prompts import (
     fallback_coaching_message,
     fallback_improvement_message,
 )
+from bot.utils import CallbackAction, to_utc
 
 
 logger = logging.getLogger(__name__)
 WEEKEND_DAYS = {5, 6}  # Saturday, Sunday
+COACHING_PREWARM_LEAD = timedelta(hours=1)
+# Jobs scheduled for the same tick share one user-id read.
+JOB_USER_IDS_TTL_SECONDS = 30.0
+_JOB_USER_IDS_KEY = "job_user_ids"
+COACHING_MEMO_TTL_SECONDS = 6 * 3600.0
+COACHING_MEMO_MAX_SIZE = 256
 DAILY_REFLECTION_QUESTIONS = (
     {
         "key": "who_am_i",
@@ -56,6 +67,13 @@ _RESISTANCE_WORDS = {
     "cannot",
     "can't",
 }
+# Longest first so "avoiding" is not cut short at "avoid"; no trailing \b so "procrast" matches its stem.
+_MOMENTUM_RE = re.compile(
+    r"(?i)\b(?:" + "|".join(map(re.escape, sorted(_MOMENTUM_WORDS, key=len, reverse=True))) + ")"
+)
+_RESISTANCE_RE = re.compile(
+    r"(?i)\b(?:" + "|".join(map(re.escape, sorted(_RESISTANCE_WORDS, key=len, reverse=True))) + ")"
+)
 _MONEY_KEYWORDS = {
     "sales",
     "sell",
@@ -74,126 +92,326 @@ _MONEY_KEYWORDS = {
     "campaign",
     "market",
 }
+_MONEY_RE = re.compile("|".join(map(re.escape, sorted(_MONEY_KEYWORDS))), re.IGNORECASE)
+_MONEY_PROJECT_TYPES = frozenset({"sales", "marketing", "product"})
 _WINDOWS = {
     "early_morning": (5, 8),
     "morning": (9, 11),
     "afternoon": (12, 16),
     "evening": (17, 21),
 }
-
-
-def generate_coaching_message(context: ContextTypes.DEFAULT_TYPE, user_id: int, weekly: bool = False) -> str:
-    store = context.application.bot_data["store"]
+# hour (UTC) -> completion window, or None for hours outside every window.
+_HOUR_TO_WINDOW: tuple[Optional[str], ...] = tuple(
+    next((window for window, (start, end) in _WINDOWS.items() if start <= hour <= end), None) for hour in range(24)
+)
+_HEADING_RE = re.compile(r"^\s{0,3}#{1,6}\s*")
+_NUMBERED_RE = re.compile(r"^(\d+)\.\s+(.*)$")
+_BULLET_RE = re.compile(r"^\s*[-*]\s+")
+_INDENT_RE = re.compile(r"^\s+\S")
+# Single underscores are left alone so snake_case and URLs in the model output survive.
+_MD_STRIP = str.maketrans("", "", "`*")
+# (user_id, prompt) -> (monotonic expiry, normalized AI message). Catches re-renders whose inputs did
+# not change, e.g. a prewarmed message for tomorrow or a store cache entry that was cleared needlessly.
+_COACHING_MEMO: OrderedDict[tuple[int, str], tuple[float, str]] = OrderedDict()
+
+
+async def generate_coaching_message(
+    context: ContextTypes.DEFAULT_TYPE, user_id: int, weekly: bool = False
+) -> tuple[str, bool]:
+    # Returns (message, from_ai); callers only persist messages the model actually wrote.
+    store = context.application.bot_data["async_store"]
     settings = context.application.bot_data["settings"]
     ai = context.application.bot_data["ai"]
 
-    profile = store.get_user_profile(user_id)
-    main_goal = profile.get("main_goal", "make money")
-    active_todos = store.list_active_todos(user_id, limit=30)
-    completed_todos = store.get_recent_completed_todos(user_id, days=120, limit=300)
-    stale_todos = store.get_stale_todos(user_id, stale_days=settings.stale_task_days, limit=10)
-    overdue_todos = store.get_overdue_todos(user_id, limit=10)
-    stats = store.get_stats(user_id)
-    recent_notes = store.get_recent_journal_entries(user_id, limit=10)
-    recent_reflections = store.get_recent_reflection_answers(user_id, limit=8)
-    learning_profile = _build_learning_profile(
-        active_todos=active_todos,
-        completed_todos=completed_todos,
-        recent_notes=recent_notes,
-        recent_reflections=recent_reflections,
-        stale_todos=stale_todos,
-        overdue_todos=overdue_todos,
-    )
+    # The MongoDB reads and profile math are blocking; keep them off the event loop.
+    inputs = await store.run(_load_coaching_inputs, store.sync, user_id, stale_days=settings.stale_task_days)
+    if not inputs["has_activity"]:
+        # Nothing for the model to personalise yet; the fallback says the same without an API call.
+        return _finish_coaching_message("", inputs), False
+    prompt = _coaching_prompt(inputs, stale_days=settings.stale_task_days, weekly=weekly)
+    memoized = _memoized_coaching(user_id, prompt)
+    if memoized is not None:
+        return memoized, True
+    ai_message = await ai.generate(COACH_SYSTEM_PROMPT, prompt)
+    message = _finish_coaching_message(ai_message, inputs)
+    if ai_message:
+        _memoize_coaching(user_id, prompt, message)
+    return message, bool(ai_message)
+
 
-    prompt = build_checkin_prompt(
-        main_goal=main_goal,
-        active_todos=active_todos,
-        stale_todos=stale_todos,
-        overdue_todos=overdue_todos,
-        stats=stats,
-        recent_notes=recent_notes,
-        recent_reflections=recent_reflections,
-        learning_profile=learning_profile,
-        stale_days=settings.stale_task_days,
+async def generate_coaching_messages(
+    context: ContextTypes.DEFAULT_TYPE, user_ids: list[int], weekly: bool = False
+) -> dict[int, tuple[str, bool]]:
+    # Job-side variant: load every user's inputs, then hand all prompts to the AI client in one batch.
+    store = context.application.bot_data["async_store"]
+    settings = context.application.bot_data["settings"]
+    ai = context.application.bot_data["ai"]
+    semaphore = asyncio.Semaphore(settings.job_user_concurrency)
+    inputs_by_user: dict[int, dict[str, Any]] = {}
+
+    async def _load(user_id: int) -> None:
+        async with semaphore:
+            try:
+                inputs_by_user[user_id] = await store.run(
+                    _load_coaching_inputs, store.sync, user_id, stale_days=settings.stale_task_days
+                )
+            except Exception as exc:  # pragma: no cover
+                logger.warning("Loading coaching inputs failed for user %s: %s", user_id, exc)
+
+    await asyncio.gather(*(_load(user_id) for user_id in user_ids))
+    messages: dict[int, tuple[str, bool]] = {}
+    to_generate: list[tuple[int, str]] = []
+    for user_id, inputs in inputs_by_user.items():
+        # Idle users skip the model and get the fallback message.
+        if not inputs["has_activity"]:
+            messages[user_id] = (_finish_coaching_message("", inputs), False)
+            continue
+        prompt = _coaching_prompt(inputs, stale_days=settings.stale_task_days, weekly=weekly)
+        memoized = _memoized_coaching(user_id, prompt)
+        if memoized is not None:
+            messages[user_id] = (memoized, True)
+        else:
+            to_generate.append((user_id, prompt))
+
+    if to_generate:
+        ai_messages = await ai.generate_batch(COACH_SYSTEM_PROMPT, [prompt for _, prompt in to_generate])
+        for (user_id, prompt), ai_message in zip(to_generate, ai_messages):
+            message = _finish_coaching_message(ai_message, inputs_by_user[user_id])
+            messages[user_id] = (message, bool(ai_message))
+            if ai_message:
+                _memoize_coaching(user_id, prompt, message)
+    return messages
+
+
+def _memoized_coaching(user_id: int, prompt: str) -> Optional[str]:
+    key = (user_id, prompt)
+    entry = _COACHING_MEMO.get(key)
+    if entry is None:
+        return None
+    if entry[0] <= monotonic():
+        _COACHING_MEMO.pop(key, None)
+        return None
+    _COACHING_MEMO.move_to_end(key)
+    return entry[1]
+
+
+def _memoize_coaching(user_id: int, prompt: str, message: str) -> None:
+    _COACHING_MEMO[(user_id, prompt)] = (monotonic() + COACHING_MEMO_TTL_SECONDS, message)
+    _COACHING_MEMO.move_to_end((user_id, prompt))
+    if len(_COACHING_MEMO) > COACHING_MEMO_MAX_SIZE:
+        _COACHING_MEMO.popitem(last=False)
+
+
+def _coaching_prompt(inputs: dict[str, Any], stale_days: int, weekly: bool) -> str:
+    return build_checkin_prompt(
+        main_goal=inputs["main_goal"],
+        active_todos=inputs["active_todos"],
+        stale_todos=inputs["stale_todos"],
+        overdue_todos=inputs["overdue_todos"],
+        stats=inputs["stats"],
+        recent_notes=inputs["recent_notes"],
+        recent_reflections=inputs["recent_reflections"],
+        learning_profile=inputs["learning_profile"],
+        stale_days=stale_days,
         weekly=weekly,
     )
-    ai_message = ai.generate(COACH_SYSTEM_PROMPT, prompt)
+
+
+def _finish_coaching_message(ai_message: str, inputs: dict[str, Any]) -> str:
     if ai_message:
         return _normalize_coaching_output(ai_message)
 
     return _normalize_coaching_output(
         fallback_coaching_message(
-            main_goal=main_goal,
-            active_todos=active_todos,
-            stale_todos=stale_todos,
-            overdue_todos=overdue_todos,
-            learning_profile=learning_profile,
+            main_goal=inputs["main_goal"],
+            active_todos=inputs["active_todos"],
+            stale_todos=inputs["stale_todos"],
+            overdue_todos=inputs["overdue_todos"],
+            learning_profile=inputs["learning_profile"],
         )
     )
 
 
-def generate_improvement_message(context: ContextTypes.DEFAULT_TYPE, user_id: int) -> str:
-    store = context.application.bot_data["store"]
+async def generate_improvement_message(context: ContextTypes.DEFAULT_TYPE, user_id: int) -> tuple[str, bool]:
+    store = context.application.bot_data["async_store"]
     ai = context.application.bot_data["ai"]
 
-    profile = store.get_user_profile(user_id)
-    main_goal = profile.get("main_goal", "make money")
-    active_todos = store.list_active_todos(user_id, limit=40)
-    completed_todos = store.get_recent_completed_todos(user_id, days=180, limit=400)
-    stale_todos = store.get_stale_todos(user_id, stale_days=7, limit=20)
-    overdue_todos = store.get_overdue_todos(user_id, limit=20)
-    recent_notes = store.get_recent_journal_entries(user_id, limit=20)
-    recent_reflections = store.get_recent_reflection_answers(user_id, limit=12)
-    learning_profile = _build_learning_profile(
-        active_todos=active_todos,
-        completed_todos=completed_todos,
-        recent_notes=recent_notes,
-        recent_reflections=recent_reflections,
-        stale_todos=stale_todos,
-        overdue_todos=overdue_todos,
+    inputs = await store.run(_load_improvement_inputs, store.sync, user_id)
+    if inputs["has_activity"]:
+        prompt = build_improvement_prompt(
+            main_goal=inputs["main_goal"],
+            active_todos=inputs["active_todos"],
+            recent_notes=inputs["recent_notes"],
+            recent_reflections=inputs["recent_reflections"],
+            learning_profile=inputs["learning_profile"],
+        )
+        ai_message = await ai.generate(COACH_SYSTEM_PROMPT, prompt)
+        if ai_message:
+            return _normalize_coaching_output(ai_message), True
+
+    fallback = fallback_improvement_message(
+        learning_profile=inputs["learning_profile"],
+        main_goal=inputs["main_goal"],
     )
+    return _normalize_coaching_output(fallback), False
+
+
+def _load_coaching_inputs(store: Any, user_id: int, stale_days: int) -> dict[str, Any]:
+    profile = store.get_user_profile(user_id, fields=("main_goal",))
+    bundle = store.get_coaching_bundle(
+        user_id,
+        active_limit=30,
+        completed_days=120,
+        completed_limit=300,
+        stale_days=stale_days,
+        stale_limit=10,
+        overdue_limit=10,
+        notes_limit=10,
+        reflections_limit=8,
+    )
+    return {
+        "main_goal": profile.get("main_goal", "make money"),
+        "active_todos": bundle.active_todos,
+        "stale_todos": bundle.stale_todos,
+        "overdue_todos": bundle.overdue_todos,
+        "stats": bundle.stats,
+        "recent_notes": bundle.recent_notes,
+        "recent_reflections": bundle.recent_reflections,
+        "learning_profile": _learning_profile_from_bundle(bundle),
+        "has_activity": _has_activity(bundle),
+    }
 
-    prompt = build_improvement_prompt(
-        main_goal=main_goal,
-        active_todos=active_todos,
-        recent_notes=recent_notes,
-        recent_reflections=recent_reflections,
-        learning_profile=learning_profile,
+
+def _load_improvement_inputs(store: Any, user_id: int) -> dict[str, Any]:
+    profile = store.get_user_profile(user_id, fields=("main_goal",))
+    bundle = store.get_coaching_bundle(
+        user_id,
+        active_limit=40,
+        completed_days=180,
+        completed_limit=400,
+        stale_days=7,
+        stale_limit=20,
+        overdue_limit=20,
+        notes_limit=20,
+        reflections_limit=12,
     )
-    ai_message = ai.generate(COACH_SYSTEM_PROMPT, prompt)
-    if ai_message:
-        return _normalize_coaching_output(ai_message)
+    return {
+        "main_goal": profile.get("main_goal", "make money"),
+        "active_todos": bundle.active_todos,
+        "recent_notes": bundle.recent_notes,
+        "recent_reflections": bundle.recent_reflections,
+        "learning_profile": _learning_profile_from_bundle(bundle),
+        "has_activity": _has_activity(bundle),
+    }
 
-    return _normalize_coaching_output(
-        fallback_improvement_message(
-            learning_profile=learning_profile,
-            main_goal=main_goal,
-        )
+
+def _has_activity(bundle: CoachingBundle) -> bool:
+    return bool(bundle.active_todos or bundle.completed_todos or bundle.recent_notes or bundle.recent_reflections)
+
+
+def _learning_profile_from_bundle(bundle: CoachingBundle) -> dict[str, Any]:
+    return _build_learning_profile(
+        active_todos=bundle.active_todos,
+        completed_todos=bundle.completed_todos,
+        recent_notes=bundle.recent_notes,
+        recent_reflections=bundle.recent_reflections,
+        stale_todos=bundle.stale_todos,
+        overdue_todos=bundle.overdue_todos,
+    )
+
+
+async def get_coaching_message(
+    context: ContextTypes.DEFAULT_TYPE,
+    user_id: int,
+    weekly: bool = False,
+    for_date: Optional[date] = None,
+) -> str:
+    # Serve the day's coaching from the store when present; tasks or goal changes clear it.
+    store = context.application.bot_data["async_store"]
+    kind = "review" if weekly else "checkin"
+    day = for_date or datetime.now(timezone.utc).date()
+    cached = await store.get_cached_coaching(user_id, kind, day)
+    if cached:
+        return cached
+    epoch = store.sync.coaching_epoch(user_id)
+    message, from_ai = await generate_coaching_message(context, user_id=user_id, weekly=weekly)
+    # A fallback written during an OpenAI outage must not stick for the rest of the day.
+    if from_ai:
+        await store.set_cached_coaching(user_id, kind, day, message, epoch=epoch)
+    return message
+
+
+async def get_coaching_messages(
+    context: ContextTypes.DEFAULT_TYPE,
+    user_ids: list[int],
+    weekly: bool = False,
+    for_date: Optional[date] = None,
+) -> dict[int, str]:
+    store = context.application.bot_data["async_store"]
+    kind = "review" if weekly else "checkin"
+    day = for_date or datetime.now(timezone.utc).date()
+    cached = await asyncio.gather(
+        *(store.get_cached_coaching(user_id, kind, day) for user_id in user_ids),
+        return_exceptions=True,
+    )
+    messages = {user_id: message for user_id, message in zip(user_ids, cached) if isinstance(message, str) and message}
+    missing = [user_id for user_id in user_ids if user_id not in messages]
+    if not missing:
+        return messages
+
+    epochs = {user_id: store.sync.coaching_epoch(user_id) for user_id in missing}
+    generated = await generate_coaching_messages(context, missing, weekly=weekly)
+    await asyncio.gather(
+        *(
+            store.set_cached_coaching(user_id, kind, day, message, epoch=epochs[user_id])
+            for user_id, (message, from_ai) in generated.items()
+            if from_ai
+        ),
+        return_exceptions=True,
     )
+    messages.update((user_id, message) for user_id, (message, _) in generated.items())
+    return messages
+
+
+async def get_improvement_message(context: ContextTypes.DEFAULT_TYPE, user_id: int) -> str:
+    store = context.application.bot_data["async_store"]
+    day = datetime.now(timezone.utc).date()
+    cached = await store.get_cached_coaching(user_id, "improve", day)
+    if cached:
+        return cached
+    epoch = store.sync.coaching_epoch(user_id)
+    message, from_ai = await generate_improvement_message(context, user_id=user_id)
+    if from_ai:
+        await store.set_cached_coaching(user_id, "improve", day, message, epoch=epoch)
+    return message
+
+
+async def coaching_prewarm_job(context: ContextTypes.DEFAULT_TYPE) -> None:
+    # Runs ahead of the daily check-in so the check-in job and /checkin hit the cache.
+    for_date = (datetime.now(timezone.utc) + COACHING_PREWARM_LEAD).date()
+    user_ids = await _job_user_ids(context)
+    await get_coaching_messages(context, user_ids, weekly=False, for_date=for_date)
 
 
 async def daily_checkin_job(context: ContextTypes.DEFAULT_TYPE) -> None:
-    for user_id in _target_user_ids(context):
-        try:
-            message = generate_coaching_message(context, user_id=user_id, weekly=False)
-            await context.bot.send_message(
-                chat_id=user_id,
-                text=f"Daily Check-in\n\n{message}",
-            )
-        except Exception as exc:  # pragma: no cover
-            logger.warning("Daily check-in failed for user %s: %s", user_id, exc)
+    await _send_coaching_to_users(context, "Daily Check-in", weekly=False)
 
 
 async def weekly_review_job(context: ContextTypes.DEFAULT_TYPE) -> None:
-    for user_id in _target_user_ids(context):
-        try:
-            message = generate_coaching_message(context, user_id=user_id, weekly=True)
-            await context.bot.send_message(
-                chat_id=user_id,
-                text=f"Weekly Review\n\n{message}",
-            )
-        except Exception as exc:  # pragma: no cover
-            logger.warning("Weekly review failed for user %s: %s", user_id, exc)
+    await _send_coaching_to_users(context, "Weekly Review", weekly=True)
+
+
+async def _send_coaching_to_users(context: ContextTypes.DEFAULT_TYPE, title: str, weekly: bool) -> None:
+    user_ids = await _job_user_ids(context)
+    messages = await get_coaching_messages(context, user_ids, weekly=weekly)
+
+    async def _run(user_id: int) -> None:
+        message = messages.get(user_id)
+        if message is None:
+            return
+        await context.bot.send_message(chat_id=user_id, text=f"{title}\n\n{message}")
+
+    await _for_each_user(context, title, _run, user_ids=user_ids)
 
 
 def _build_learning_profile(
@@ -205,7 +423,9 @@ def _build_learning_profile(
     stale_todos: list[dict[str, Any]],
     overdue_todos: list[dict[str, Any]],
 ) -> dict[str, Any]:
-    durations: list[float] = []
+    duration_total = 0.0
+    duration_count = 0
+    # project_type -> [completed count, total days]
     project_type_durations: dict[str, list[float]] = {}
     completion_window_counts = {window: 0 for window in _WINDOWS}
 
@@ -214,28 +434,28 @@ def _build_learning_profile(
         completed = todo.get("completed_at")
         if created and completed:
             duration = max((completed - created).total_seconds() / 86400.0, 0.0)
-            durations.append(duration)
-            project_type = str(todo.get("project_type", "general"))
-            project_type_durations.setdefault(project_type, []).append(duration)
+            duration_total += duration
+            duration_count += 1
+            totals = project_type_durations.setdefault(str(todo.get("project_type", "general")), [0, 0.0])
+            totals[0] += 1
+            totals[1] += duration
 
         if completed:
-            hour = int(completed.astimezone(timezone.utc).hour)
-            for window, (start, end) in _WINDOWS.items():
-                if start <= hour <= end:
-                    completion_window_counts[window] += 1
-                    break
+            window = _HOUR_TO_WINDOW[to_utc(completed).hour]
+            if window is not None:
+                completion_window_counts[window] += 1
 
-    active_high = [todo for todo in active_todos if int(todo.get("priority", 2)) == 1]
-    overdue_high = [todo for todo in overdue_todos if int(todo.get("priority", 2)) == 1]
-    stale_high = [todo for todo in stale_todos if int(todo.get("priority", 2)) == 1]
+    active_high = _count_high_priority(active_todos)
+    overdue_high = _count_high_priority(overdue_todos)
+    stale_high = _count_high_priority(stale_todos)
 
     conflict_flags: list[str] = []
-    if len(active_high) > 4:
-        conflict_flags.append(f"too many high-priority tasks in parallel ({len(active_high)})")
+    if active_high > 4:
+        conflict_flags.append(f"too many high-priority tasks in parallel ({active_high})")
     if overdue_high:
-        conflict_flags.append(f"overdue high-priority tasks ({len(overdue_high)})")
-    if len(stale_high) >= 2:
-        conflict_flags.append(f"stale high-priority tasks ({len(stale_high)})")
+        conflict_flags.append(f"overdue high-priority tasks ({overdue_high})")
+    if stale_high >= 2:
+        conflict_flags.append(f"stale high-priority tasks ({stale_high})")
     due_soon = _count_due_soon(active_todos, days=7)
     if due_soon >= 5:
         conflict_flags.append(f"deadline cluster in next 7 days ({due_soon} tasks)")
@@ -245,30 +465,18 @@ def _build_learning_profile(
     )
     money_ratio = _money_aligned_ratio(active_todos)
 
-    project_type_breakdown_lines = []
-    for project_type, values in sorted(
-        project_type_durations.items(),
-        key=lambda item: len(item[1]),
-        reverse=True,
-    ):
-        if not values:
-            continue
-        project_type_breakdown_lines.append(
-            f"{project_type}: count={len(values)}, avg_days={mean(values):.1f}"
-        )
+    # Sorted once; feeds both the breakdown lines and the top project types.
+    ranked_project_types = sorted(project_type_durations.items(), key=lambda item: item[1][0], reverse=True)
+    project_type_breakdown_lines = [
+        f"{project_type}: count={count}, avg_days={total / count:.1f}"
+        for project_type, (count, total) in ranked_project_types
+    ]
 
     return {
         "completed_tasks_sample": len(completed_todos),
-        "avg_completion_days": round(mean(durations), 1) if durations else None,
+        "avg_completion_days": round(duration_total / duration_count, 1) if duration_count else None,
         "best_completion_window": _best_completion_window(completion_window_counts),
-        "top_project_types": [
-            project_type
-            for project_type, values in sorted(
-                project_type_durations.items(),
-                key=lambda item: len(item[1]),
-                reverse=True,
-            )[:3]
-        ],
+        "top_project_types": [project_type for project_type, _ in ranked_project_types[:3]],
         "project_type_breakdown_lines": project_type_breakdown_lines,
         "willingness_score": willingness_score,
         "momentum_signals": momentum_signals,
@@ -278,6 +486,10 @@ def _build_learning_profile(
     }
 
 
+def _count_high_priority(todos: list[dict[str, Any]]) -> int:
+    return sum(1 for todo in todos if int(todo.get("priority", 2)) == 1)
+
+
 def _count_due_soon(active_todos: list[dict[str, Any]], days: int) -> int:
     now = datetime.now(timezone.utc)
     threshold = now + timedelta(days=days)
@@ -298,13 +510,8 @@ def _estimate_willingness(recent_notes: list[str]) -> tuple[int, int, int]:
     momentum = 0
     resistance = 0
     for note in recent_notes:
-        text = note.lower()
-        for word in _MOMENTUM_WORDS:
-            if word in text:
-                momentum += 1
-        for word in _RESISTANCE_WORDS:
-            if word in text:
-                resistance += 1
+        momentum += len(_MOMENTUM_RE.findall(note))
+        resistance += len(_RESISTANCE_RE.findall(note))
 
     raw_score = 3 + (momentum - resistance) * 0.2
     willingness = int(max(1, min(5, round(raw_score))))
@@ -316,9 +523,8 @@ def _money_aligned_ratio(active_todos: list[dict[str, Any]]) -> float:
         return 0.0
     aligned = 0
     for todo in active_todos:
-        title = str(todo.get("title", "")).lower()
         project_type = str(todo.get("project_type", ""))
-        if any(keyword in title for keyword in _MONEY_KEYWORDS) or project_type in {"sales", "marketing", "product"}:
+        if project_type in _MONEY_PROJECT_TYPES or _MONEY_RE.search(str(todo.get("title", ""))):
             aligned += 1
     return aligned / len(active_todos)
 
@@ -330,16 +536,15 @@ def _normalize_coaching_output(text: str) -> str:
         if line.startswith("```"):
             continue
 
-        line = re.sub(r"^\s{0,3}#{1,6}\s*", "", line)
-        numbered = re.match(r"^(\d+)\.\s+(.*)$", line)
+        line = _HEADING_RE.sub("", line, count=1)
+        numbered = _NUMBERED_RE.match(line)
         if numbered:
             line = f"{numbered.group(1)}) {numbered.group(2)}"
 
-        line = line.replace("**", "").replace("__", "").replace("`", "").replace("*", "")
+        line = line.replace("**", "").replace("__", "").translate(_MD_STRIP)
 
-        if re.match(r"^\s*[-*]\s+", line):
-            line = re.sub(r"^\s*[-*]\s+", "- ", line)
-        elif re.match(r"^\s+\S", raw_line):
+        line, bullets = _BULLET_RE.subn("- ", line, count=1)
+        if not bullets and _INDENT_RE.match(raw_line):
             line = raw_line.strip()
 
         cleaned_lines.append(line)
@@ -358,123 +563,144 @@ def _normalize_coaching_output(text: str) -> str:
     return "\n".join(normalized).strip()
 
 
-def _target_user_ids(context: ContextTypes.DEFAULT_TYPE) -> list[int]:
+async def _job_user_ids(context: ContextTypes.DEFAULT_TYPE) -> list[int]:
+    bot_data = context.application.bot_data
+    now = monotonic()
+    cached = bot_data.get(_JOB_USER_IDS_KEY)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+    user_ids = await context.application.bot_data["async_store"].run(list, _target_user_ids(context))
+    bot_data[_JOB_USER_IDS_KEY] = (now + JOB_USER_IDS_TTL_SECONDS, user_ids, frozenset(user_ids))
+    return user_ids
+
+
+def forget_job_user_ids(bot_data: dict[str, Any], user_id: int) -> None:
+    # Called when a user is upserted; only a user the cached list has not seen makes it stale.
+    cached = bot_data.get(_JOB_USER_IDS_KEY)
+    if cached is not None and user_id not in cached[2]:
+        bot_data.pop(_JOB_USER_IDS_KEY, None)
+
+
+def _target_user_ids(context: ContextTypes.DEFAULT_TYPE) -> Iterable[int]:
     store = context.application.bot_data["store"]
     settings = context.application.bot_data["settings"]
     if settings.allowed_chat_id is not None:
         return [settings.allowed_chat_id]
-    return store.list_user_ids()
+    return store.iter_user_ids()
+
+
+async def _for_each_user(
+    context: ContextTypes.DEFAULT_TYPE,
+    label: str,
+    run: Callable[[int], Awaitable[None]],
+    user_ids: Optional[list[int]] = None,
+) -> None:
+    # Users are independent, so fan out; the semaphore keeps Telegram and MongoDB load bounded.
+    semaphore = asyncio.Semaphore(context.application.bot_data["settings"].job_user_concurrency)
 
+    async def _guarded(user_id: int) -> None:
+        async with semaphore:
+            try:
+                await run(user_id)
+            except Exception as exc:  # pragma: no cover
+                logger.warning("%s failed for user %s: %s", label, user_id, exc)
 
+    if user_ids is None:
+        user_ids = await _job_user_ids(context)
+    await asyncio.gather(*(_guarded(user_id) for user_id in user_ids))
+
+
+# PTB 20 Telegram objects are immutable, so one markup per chore can be shared by every reminder.
+@functools.lru_cache(maxsize=1024)
 def _build_chore_action_keyboard(chore_id: str) -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(
         [
             [
-                InlineKeyboardButton("Done", callback_data=f"chore_done:{chore_id}"),
-                InlineKeyboardButton("Not done", callback_data=f"chore_not_done:{chore_id}"),
+                InlineKeyboardButton("Done", callback_data=CallbackAction.CHORE_DONE.data(chore_id)),
+                InlineKeyboardButton("Not done", callback_data=CallbackAction.CHORE_NOT_DONE.data(chore_id)),
             ],
-            [InlineKeyboardButton("Pass weekend", callback_data=f"chore_pass_weekend:{chore_id}")],
+            [InlineKeyboardButton("Pass weekend", callback_data=CallbackAction.CHORE_PASS_WEEKEND.data(chore_id))],
         ]
     )
 
 
 async def chores_morning_job(context: ContextTypes.DEFAULT_TYPE) -> None:
-    store = context.application.bot_data["store"]
     now = datetime.now(timezone.utc)
     if now.weekday() not in WEEKEND_DAYS:
         return
 
-    for user_id in _target_user_ids(context):
-        try:
-            store.ensure_default_chores(user_id)
-            due_chores = store.list_due_chores(user_id=user_id, on_date=now.date())
-            if not due_chores:
-                continue
+    header = "Weekend chore reminder (morning)\n\nPlease answer each chore one by one."
 
-            await context.bot.send_message(
-                chat_id=user_id,
-                text=(
-                    "Weekend chore reminder (morning)\n\n"
-                    "Please answer each chore one by one."
-                ),
-            )
-            for chore in due_chores:
-                chore_id = str(chore.get("_id"))
-                name = str(chore.get("name", ""))
-                due_day = "n/a"
-                next_due = chore.get("next_due_date")
-                if next_due:
-                    due_day = next_due.astimezone(timezone.utc).strftime("%Y-%m-%d")
-                await context.bot.send_message(
-                    chat_id=user_id,
-                    text=f"{name}\nDue since: {due_day}\n\nDone today?",
-                    reply_markup=_build_chore_action_keyboard(chore_id),
-                )
-        except Exception as exc:  # pragma: no cover
-            logger.warning("Morning chores reminder failed for user %s: %s", user_id, exc)
+    async def _run(user_id: int) -> None:
+        await _send_due_chores(context, user_id, now.date(), header)
+
+    await _for_each_user(context, "Morning chores reminder", _run)
 
 
 async def chores_eod_confirmation_job(context: ContextTypes.DEFAULT_TYPE) -> None:
-    store = context.application.bot_data["store"]
     now = datetime.now(timezone.utc)
     if now.weekday() not in WEEKEND_DAYS:
         return
 
-    for user_id in _target_user_ids(context):
-        try:
-            store.ensure_default_chores(user_id)
-            due_chores = store.list_due_chores(user_id=user_id, on_date=now.date())
-            if not due_chores:
+    header = (
+        "End-of-day chore confirmation\n\n"
+        "Please confirm each chore.\n"
+        "Anything not done stays in weekend reminders."
+    )
+
+    async def _run(user_id: int) -> None:
+        await _send_due_chores(context, user_id, now.date(), header)
+
+    await _for_each_user(context, "EOD chores confirmation", _run)
+
+
+async def _send_due_chores(context: ContextTypes.DEFAULT_TYPE, user_id: int, on_date: date, header: str) -> None:
+    store = context.application.bot_data["async_store"]
+    await store.ensure_current_default_chores(user_id)
+    due_chores = await store.list_due_chores(user_id=user_id, on_date=on_date)
+    if not due_chores:
+        return
+
+    # Sequential within a user so the header and the chores arrive in order.
+    await context.bot.send_message(chat_id=user_id, text=header)
+    for chore in due_chores:
+        chore_id = str(chore.get("_id"))
+        name = str(chore.get("name", ""))
+        due_day = "n/a"
+        next_due = chore.get("next_due_date")
+        if next_due:
+            due_day = to_utc(next_due).strftime("%Y-%m-%d")
+        await context.bot.send_message(
+            chat_id=user_id,
+            text=f"{name}\nDue since: {due_day}\n\nDone today?",
+            reply_markup=_build_chore_action_keyboard(chore_id),
+        )
+
+
+async def daily_reflection_question_job(context: ContextTypes.DEFAULT_TYPE) -> None:
+    store = context.application.bot_data["async_store"]
+    now = datetime.now(timezone.utc)
+
+    async def _run(user_id: int) -> None:
+        created_keys = set(
+            await store.ensure_daily_reflection_prompts_bulk(
+                user_id=user_id,
+                questions=DAILY_REFLECTION_QUESTIONS,
+                asked_at=now,
+            )
+        )
+        for question in DAILY_REFLECTION_QUESTIONS:
+            if question["key"] not in created_keys:
                 continue
 
             await context.bot.send_message(
                 chat_id=user_id,
                 text=(
-                    "End-of-day chore confirmation\n\n"
-                    "Please confirm each chore.\n"
-                    "Anything not done stays in weekend reminders."
+                    "Daily Reflection (5 min)\n\n"
+                    f"{question['text']}\n\n"
+                    "Reply with your answer. I will store it for future analysis.\n"
+                    "If you're not motivated today, send /pass."
                 ),
             )
-            for chore in due_chores:
-                chore_id = str(chore.get("_id"))
-                name = str(chore.get("name", ""))
-                due_day = "n/a"
-                next_due = chore.get("next_due_date")
-                if next_due:
-                    due_day = next_due.astimezone(timezone.utc).strftime("%Y-%m-%d")
-                await context.bot.send_message(
-                    chat_id=user_id,
-                    text=f"{name}\nDue since: {due_day}\n\nDone today?",
-                    reply_markup=_build_chore_action_keyboard(chore_id),
-                )
-        except Exception as exc:  # pragma: no cover
-            logger.warning("EOD chores confirmation failed for user %s: %s", user_id, exc)
-
 
-async def daily_reflection_question_job(context: ContextTypes.DEFAULT_TYPE) -> None:
-    store = context.application.bot_data["store"]
-    now = datetime.now(timezone.utc)
-
-    for user_id in _target_user_ids(context):
-        try:
-            for question in DAILY_REFLECTION_QUESTIONS:
-                created = store.ensure_daily_reflection_prompt(
-                    user_id=user_id,
-                    question_key=question["key"],
-                    question=question["text"],
-                    asked_at=now,
-                )
-                if not created:
-                    continue
-
-                await context.bot.send_message(
-                    chat_id=user_id,
-                    text=(
-                        "Daily Reflection (5 min)\n\n"
-                        f"{question['text']}\n\n"
-                        "Reply with your answer. I will store it for future analysis.\n"
-                        "If you're not motivated today, send /pass."
-                    ),
-                )
-        except Exception as exc:  # pragma: no cover
-            logger.warning("Daily reflection prompt failed for user %s: %s", user_id, exc)
+    await _for_each_user(context, "Daily reflection prompt", _run)
@@ -1,18 +1,22 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import time, timezone
+from datetime import date, datetime, time, timezone
 
 from telegram import BotCommand
-from telegram.ext import Application
+from telegram.ext import AIORateLimiter, Application
 
 from bot.ai import AICoach
+from bot.async_store import AsyncStore
 from bot.config import load_settings
-from bot.db import MongoStore
-from bot.handlers import build_handlers
+from bot.db import get_store
+from bot.handlers import bind_dependencies, build_auth_gate, build_handlers
 from bot.jobs import (
+    COACHING_PREWARM_LEAD,
     chores_eod_confirmation_job,
     chores_morning_job,
+    coaching_prewarm_job,
     daily_checkin_job,
     daily_reflection_question_job,
     weekly_review_job,
@@ -56,26 +60,55 @@ async def _register_telegram_commands(application: Application) -> None:
     )
 
 
+async def _post_init(application: Application) -> None:
+    bind_dependencies(application)
+    await _register_telegram_commands(application)
+    # Warm the OpenAI connection in the background so an unreachable API cannot delay polling.
+    # Application.create_task warns while the app is not yet running, hence the plain loop task.
+    application.bot_data["ai_warmup"] = asyncio.get_running_loop().create_task(application.bot_data["ai"].warmup())
+
+
+async def _post_shutdown(application: Application) -> None:
+    application.bot_data["store"].flush_journal()
+    warmup = application.bot_data.pop("ai_warmup", None)
+    if warmup is not None and not warmup.done():
+        warmup.cancel()
+    await application.bot_data["ai"].aclose()
+
+
 def main() -> None:
     settings = load_settings()
-    store = MongoStore(uri=settings.mongodb_uri, db_name=settings.mongodb_db)
+    store = get_store(uri=settings.mongodb_uri, db_name=settings.mongodb_db)
     store.ping()
     ai = AICoach(api_key=settings.openai_api_key, model=settings.openai_model)
 
     application = (
         Application.builder()
         .token(settings.telegram_bot_token)
-        .post_init(_register_telegram_commands)
+        # Throttles bursts from concurrent handlers and job fan-out, and retries a send that still
+        # hits a 429 after the advertised wait instead of dropping it.
+        .rate_limiter(AIORateLimiter(max_retries=3))
+        .post_init(_post_init)
+        .post_shutdown(_post_shutdown)
         .build()
     )
     application.bot_data["settings"] = settings
     application.bot_data["store"] = store
+    # Handlers and jobs share one awaitable facade; the sync store stays for shutdown.
+    application.bot_data["async_store"] = AsyncStore(store)
     application.bot_data["ai"] = ai
 
+    application.add_handler(build_auth_gate(), group=-1)
     for handler in build_handlers():
         application.add_handler(handler)
 
     checkin_time = time(hour=settings.checkin_hour_utc, minute=0, tzinfo=timezone.utc)
+    prewarm_at = datetime.combine(date.today(), checkin_time) - COACHING_PREWARM_LEAD
+    application.job_queue.run_daily(
+        callback=coaching_prewarm_job,
+        time=prewarm_at.timetz(),
+        name="coaching-prewarm",
+    )
     application.job_queue.run_daily(
         callback=daily_checkin_job,
         time=checkin_time,
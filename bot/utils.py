@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import functools
 import re
 from dataclasses import dataclass
 from datetime import date, datetime, time, timezone
+from enum import IntEnum
 from typing import Optional
 
 
@@ -107,6 +109,18 @@ _DATE_PATTERN = re.compile(r"\b(\d{4}-\d{2}-\d{2})\b")
 _PRIORITY_PATTERN = re.compile(r"\b(p[123]|high|medium|med|low|urgent|[123])\b", re.IGNORECASE)
 
 
+class CallbackAction(IntEnum):
+    # Sent as the numeric prefix of button callback_data ("0:<todo id>") to keep payloads short.
+    TODO_DONE = 0
+    TODO_DELETE = 1
+    CHORE_DONE = 2
+    CHORE_NOT_DONE = 3
+    CHORE_PASS_WEEKEND = 4
+
+    def data(self, target_id: str) -> str:
+        return f"{self.value}:{target_id}"
+
+
 @dataclass(frozen=True)
 class ParsedAddPayload:
     title: str
@@ -180,10 +194,17 @@ def parse_add_payload(raw: str) -> tuple[Optional[ParsedAddPayload], Optional[st
     return ParsedAddPayload(title=title, priority=parsed_priority, deadline=parsed_deadline), None
 
 
+# Aware datetimes hash by instant, and the label is the UTC date, so cached entries never go stale.
+@functools.lru_cache(maxsize=256)
 def format_deadline(deadline: Optional[datetime]) -> str:
     if not deadline:
         return "No deadline"
-    return deadline.astimezone(timezone.utc).strftime("%Y-%m-%d")
+    return to_utc(deadline).strftime("%Y-%m-%d")
+
+
+def to_utc(value: datetime) -> datetime:
+    # The store decodes datetimes with timezone.utc, so most values need no conversion.
+    return value if value.tzinfo is timezone.utc else value.astimezone(timezone.utc)
 
 
 def task_age_days(created_at: Optional[datetime]) -> int: